@@ -1,51 +1,92 @@
 #include "engine.hpp"
 #include <iostream>
 #include <vector>
+#include <algorithm>
+#include <optional>
 #include <string>
+#include <cstdio>
+#include <sstream>
 
 using namespace uvstart;
 
-void print_usage() {
-    std::cout << "Usage: uvstart-engine <command> [options]\n";
-    std::cout << "\nCommands:\n";
-    std::cout << "  detect                     - Detect current backend\n";
-    std::cout << "  backends                   - List available backends\n";
-    std::cout << "  add <package> [--dev] [--backend <name>]   - Add package\n";
-    std::cout << "  remove <package> [--backend <name>]        - Remove package\n";
-    std::cout << "  sync [--dev] [--backend <name>]            - Sync packages\n";
-    std::cout << "  run <command...> [--backend <name>]        - Run command\n";
-    std::cout << "  list [--backend <name>]                    - List packages\n";
-    std::cout << "  version [--backend <name>]                 - Get backend version\n";
-    std::cout << "  clean [--backend <name>]                   - Clean project files\n";
-    std::cout << "  install-cmd <backend>                       - Get install command\n";
-    std::cout << "  clean-files <backend>                       - Get clean files list\n";
-    std::cout << "\nOptions:\n";
-    std::cout << "  --dev                      - Development dependencies\n";
-    std::cout << "  --backend <name>           - Specific backend to use\n";
-    std::cout << "  --path <path>              - Project path (default: current directory)\n";
+std::string json_string(const std::string& value) {
+    std::string out = "\"";
+    for (char c : value) {
+        switch (c) {
+            case '"':  out += "\\\""; break;
+            case '\\': out += "\\\\"; break;
+            case '\n': out += "\\n"; break;
+            case '\r': out += "\\r"; break;
+            case '\t': out += "\\t"; break;
+            default:
+                if (static_cast<unsigned char>(c) < 0x20) {
+                    char buf[8];
+                    std::snprintf(buf, sizeof(buf), "\\u%04x", static_cast<unsigned>(static_cast<unsigned char>(c)));
+                    out += buf;
+                } else {
+                    out += c;
+                }
+        }
+    }
+    return out + "\"";
 }
 
-int main(int argc, char* argv[]) {
-    if (argc < 2) {
-        print_usage();
+std::string trim(const std::string& value) {
+    size_t start = value.find_first_not_of(" \t\r\n");
+    if (start == std::string::npos) {
+        return "";
+    }
+    size_t end = value.find_last_not_of(" \t\r\n");
+    return value.substr(start, end - start + 1);
+}
+
+void print_usage(std::ostream& out) {
+    out << "Usage: uvstart-engine <command> [options]\n";
+    out << "\nCommands:\n";
+    out << "  detect                     - Detect current backend\n";
+    out << "  backends                   - List available backends\n";
+    out << "  info [--json]              - Current backend, available backends and version\n";
+    out << "  add <package> [--dev] [--backend <name>]   - Add package\n";
+    out << "  remove <package> [--backend <name>]        - Remove package\n";
+    out << "  sync [--dev] [--backend <name>]            - Sync packages\n";
+    out << "  run <command...> [--backend <name>]        - Run command\n";
+    out << "  list [--backend <name>]                    - List packages\n";
+    out << "  version [--backend <name>]                 - Get backend version\n";
+    out << "  clean [--backend <name>]                   - Clean project files\n";
+    out << "  install-cmd <backend>                       - Get install command\n";
+    out << "  clean-files <backend>                       - Get clean files list\n";
+    out << "\nOptions:\n";
+    out << "  --dev                      - Development dependencies\n";
+    out << "  --backend <name>           - Specific backend to use\n";
+    out << "  --path <path>              - Project path (default: current directory)\n";
+    out << "  --daemon                   - Serve commands from stdin, one JSON request per line\n";
+}
+
+/**
+ * Run one engine command. argv holds the command and its options, without
+ * the program name; all output goes to out and err.
+ */
+int dispatch(const std::vector<std::string>& argv, std::ostream& out, std::ostream& err) {
+    if (argv.empty()) {
+        print_usage(out);
         return 1;
     }
     
-    std::string command = argv[1];
+    std::string command = argv[0];
     std::string project_path = ".";
     std::string backend = "";
     bool dev = false;
     
     // Parse common options
     std::vector<std::string> args;
-    for (int i = 2; i < argc; ++i) {
-        std::string arg = argv[i];
+    for (size_t i = 1; i < argv.size(); ++i) {
+        const std::string& arg = argv[i];
         
         if (arg == "--dev") {
             dev = true;
-        } else if (arg == "--backend" && i + 1 < argc) {
+        } else if (arg == "--backend" && i + 1 < argv.size()) {
             backend = argv[++i];
-        } else if (arg == "--path" && i + 1 < argc) {
+        } else if (arg == "--path" && i + 1 < argv.size()) {
             project_path = argv[++i];
         } else {
             args.push_back(arg);
@@ -58,30 +99,62 @@ int main(int argc, char* argv[]) {
     if (command == "detect") {
         auto detected = engine.detect_backend();
         if (detected) {
-            std::cout << *detected << std::endl;
+            out << *detected << std::endl;
             return 0;
         } else {
-            std::cout << "none" << std::endl;
+            out << "none" << std::endl;
             return 1;
         }
     } 
     else if (command == "backends") {
         auto backends = engine.get_available_backends();
         for (const auto& backend : backends) {
-            std::cout << backend << std::endl;
+            out << backend << std::endl;
+        }
+        return 0;
+    }
+    else if (command == "info") {
+        // Everything the frontend's backend summary needs, in one process
+        auto detected = engine.detect_backend();
+        auto backends = engine.get_available_backends();
+        std::optional<std::string> version;
+        if (detected) {
+            auto version_result = engine.get_version(*detected);
+            if (version_result.success) {
+                version = trim(version_result.output);
+            }
+        }
+        
+        bool json = std::find(args.begin(), args.end(), "--json") != args.end();
+        if (json) {
+            out << "{\"current\": " << (detected ? json_string(*detected) : "null")
+                      << ", \"available\": [";
+            for (size_t i = 0; i < backends.size(); ++i) {
+                out << (i ? ", " : "") << json_string(backends[i]);
+            }
+            out << "], \"version\": " << (version ? json_string(*version) : "null")
+                      << "}" << std::endl;
+        } else {
+            out << "current: " << (detected ? *detected : "none") << std::endl;
+            out << "available:";
+            for (const auto& backend : backends) {
+                out << " " << backend;
+            }
+            out << std::endl;
+            out << "version: " << (version ? *version : "unknown") << std::endl;
         }
         return 0;
     }
     else if (command == "add") {
         if (args.empty()) {
-            std::cerr << "Error: Package name required" << std::endl;
+            err << "Error: Package name required" << std::endl;
             return 1;
         }
         result = engine.add_package(args[0], dev, backend);
     }
     else if (command == "remove") {
         if (args.empty()) {
-            std::cerr << "Error: Package name required" << std::endl;
+            err << "Error: Package name required" << std::endl;
             return 1;
         }
         result = engine.remove_package(args[0], backend);
@@ -91,7 +164,7 @@ int main(int argc, char* argv[]) {
     }
     else if (command == "run") {
         if (args.empty()) {
-            std::cerr << "Error: Command required" << std::endl;
+            err << "Error: Command required" << std::endl;
             return 1;
         }
         result = engine.run_command(args, backend);
@@ -107,41 +180,189 @@ int main(int argc, char* argv[]) {
     }
     else if (command == "install-cmd") {
         if (args.empty()) {
-            std::cerr << "Error: Backend name required" << std::endl;
+            err << "Error: Backend name required" << std::endl;
             return 1;
         }
         std::string install_cmd = engine.get_install_command(args[0]);
         if (install_cmd.empty()) {
-            std::cerr << "Error: Unknown backend: " << args[0] << std::endl;
+            err << "Error: Unknown backend: " << args[0] << std::endl;
             return 1;
         }
-        std::cout << install_cmd << std::endl;
+        out << install_cmd << std::endl;
         return 0;
     }
     else if (command == "clean-files") {
         if (args.empty()) {
-            std::cerr << "Error: Backend name required" << std::endl;
+            err << "Error: Backend name required" << std::endl;
             return 1;
         }
         auto clean_files = engine.get_clean_files(args[0]);
         for (const auto& file : clean_files) {
-            std::cout << file << std::endl;
+            out << file << std::endl;
         }
         return 0;
     }
     else {
-        std::cerr << "Error: Unknown command: " << command << std::endl;
-        print_usage();
+        err << "Error: Unknown command: " << command << std::endl;
+        print_usage(out);
         return 1;
     }
     
     // Output result
     if (!result.output.empty()) {
-        std::cout << result.output;
+        out << result.output;
     }
     if (!result.error.empty()) {
-        std::cerr << result.error;
+        err << result.error;
     }
     
     return result.exit_code;
-} 
\ No newline at end of file
+}
+/**
+ * Parse the "cmd" array of a request line such as {"cmd": ["detect", "--path", "x"]}.
+ * Only the subset of JSON that the frontend sends is understood.
+ */
+bool parse_request(const std::string& line, std::vector<std::string>& argv) {
+    size_t key = line.find("\"cmd\"");
+    size_t pos = key == std::string::npos ? key : line.find('[', key);
+    if (pos == std::string::npos) {
+        return false;
+    }
+    ++pos;
+    
+    auto skip_space = [&]() {
+        while (pos < line.size() && (line[pos] == ' ' || line[pos] == '\t')) {
+            ++pos;
+        }
+    };
+    auto append_utf8 = [](std::string& s, unsigned long cp) {
+        if (cp < 0x80) {
+            s += static_cast<char>(cp);
+        } else if (cp < 0x800) {
+            s += static_cast<char>(0xC0 | (cp >> 6));
+            s += static_cast<char>(0x80 | (cp & 0x3F));
+        } else if (cp < 0x10000) {
+            s += static_cast<char>(0xE0 | (cp >> 12));
+            s += static_cast<char>(0x80 | ((cp >> 6) & 0x3F));
+            s += static_cast<char>(0x80 | (cp & 0x3F));
+        } else {
+            s += static_cast<char>(0xF0 | (cp >> 18));
+            s += static_cast<char>(0x80 | ((cp >> 12) & 0x3F));
+            s += static_cast<char>(0x80 | ((cp >> 6) & 0x3F));
+            s += static_cast<char>(0x80 | (cp & 0x3F));
+        }
+    };
+    auto read_hex4 = [&](unsigned long& cp) {
+        if (pos + 4 > line.size()) {
+            return false;
+        }
+        try {
+            cp = std::stoul(line.substr(pos, 4), nullptr, 16);
+        } catch (const std::exception&) {
+            return false;
+        }
+        pos += 4;
+        return true;
+    };
+    
+    skip_space();
+    if (pos < line.size() && line[pos] == ']') {
+        return true;
+    }
+    while (pos < line.size()) {
+        skip_space();
+        if (pos >= line.size() || line[pos] != '"') {
+            return false;
+        }
+        ++pos;
+        
+        std::string value;
+        while (pos < line.size() && line[pos] != '"') {
+            char c = line[pos++];
+            if (c != '\\') {
+                value += c;
+                continue;
+            }
+            if (pos >= line.size()) {
+                return false;
+            }
+            char esc = line[pos++];
+            switch (esc) {
+                case '"':  value += '"'; break;
+                case '\\': value += '\\'; break;
+                case '/':  value += '/'; break;
+                case 'b':  value += '\b'; break;
+                case 'f':  value += '\f'; break;
+                case 'n':  value += '\n'; break;
+                case 'r':  value += '\r'; break;
+                case 't':  value += '\t'; break;
+                case 'u': {
+                    unsigned long cp;
+                    if (!read_hex4(cp)) {
+                        return false;
+                    }
+                    // Characters outside the BMP arrive as a surrogate pair
+                    if (cp >= 0xD800 && cp < 0xDC00 && line.compare(pos, 2, "\\u") == 0) {
+                        pos += 2;
+                        unsigned long low;
+                        if (!read_hex4(low)) {
+                            return false;
+                        }
+                        cp = 0x10000 + ((cp - 0xD800) << 10) + (low - 0xDC00);
+                    }
+                    append_utf8(value, cp);
+                    break;
+                }
+                default:
+                    return false;
+            }
+        }
+        if (pos >= line.size()) {
+            return false;
+        }
+        ++pos;
+        argv.push_back(value);
+        
+        skip_space();
+        if (pos < line.size() && line[pos] == ',') {
+            ++pos;
+        } else {
+            return pos < line.size() && line[pos] == ']';
+        }
+    }
+    return false;
+}
+
+/**
+ * Serve commands from stdin until it is closed. Each request line gets
+ * exactly one reply line: {"returncode": N, "stdout": "...", "stderr": "..."}.
+ */
+int serve() {
+    std::string line;
+    while (std::getline(std::cin, line)) {
+        std::vector<std::string> argv;
+        std::ostringstream out;
+        std::ostringstream err;
+        int returncode;
+        
+        if (parse_request(line, argv)) {
+            // Report what a separately spawned engine would exit with
+            returncode = dispatch(argv, out, err) & 0xFF;
+        } else {
+            err << "Error: Malformed request" << std::endl;
+            returncode = 1;
+        }
+        
+        std::cout << "{\"returncode\": " << returncode
+                  << ", \"stdout\": " << json_string(out.str())
+                  << ", \"stderr\": " << json_string(err.str()) << "}" << std::endl;
+    }
+    return 0;
+}
+
+int main(int argc, char* argv[]) {
+    if (argc == 2 && std::string(argv[1]) == "--daemon") {
+        return serve();
+    }
+    return dispatch(std::vector<std::string>(argv + 1, argv + argc), std::cout, std::cerr);
+}
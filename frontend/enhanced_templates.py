@@ -28,6 +28,16 @@ except ImportError:
     HAS_JINJA2 = False
     jinja2 = None  # type: ignore
 
+# Patterns used by the fallback renderer and the case-conversion filters,
+# which run for every rendered file
+_IF_BLOCK_RE = re.compile(
+    r'\{\%\s*if\s+([^%]+)\s*\%\}(.*?)(?:\{\%\s*elif\s+([^%]+)\s*\%\}(.*?))*(?:\{\%\s*else\s*\%\}(.*?))?\{\%\s*endif\s*\%\}',
+    re.DOTALL
+)
+_FOR_BLOCK_RE = re.compile(r'\{\%\s*for\s+(\w+)\s+in\s+(\w+)\s*\%\}(.*?)\{\%\s*endfor\s*\%\}', re.DOTALL)
+_INCLUDE_RE = re.compile(r'\{\%\s*include\s+[\'"]([^\'"]+)[\'"]\s*\%\}')
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+
 
 @dataclass
 class TemplateMetadata:
@@ -184,19 +194,19 @@ class EnhancedTemplateEngine:
     
     def _snake_case(self, text: str) -> str:
         """Convert text to snake_case"""
-        return re.sub(r'[^a-zA-Z0-9]', '_', text).lower()
+        return _NON_ALNUM_RE.sub('_', text).lower()
     
     def _camel_case(self, text: str) -> str:
         """Convert text to CamelCase"""
-        return ''.join(word.capitalize() for word in re.split(r'[^a-zA-Z0-9]', text))
+        return ''.join(word.capitalize() for word in _NON_ALNUM_RE.split(text))
     
     def _kebab_case(self, text: str) -> str:
         """Convert text to kebab-case"""
-        return re.sub(r'[^a-zA-Z0-9]', '-', text).lower()
+        return _NON_ALNUM_RE.sub('-', text).lower()
     
     def _title_case(self, text: str) -> str:
         """Convert text to Title Case"""
-        return ' '.join(word.capitalize() for word in re.split(r'[^a-zA-Z0-9]', text))
+        return ' '.join(word.capitalize() for word in _NON_ALNUM_RE.split(text))
     
     def render_string(self, template_str: str, context: Dict[str, Any]) -> str:
         """Render a template string with context variables"""
@@ -230,8 +240,6 @@ class EnhancedTemplateEngine:
     def _process_conditionals(self, template_str: str, context: Dict[str, Any]) -> str:
         """Process conditional blocks like {% if condition %}...{% endif %}"""
         # Enhanced if/elif/else/endif processing
-        pattern = r'\{\%\s*if\s+([^%]+)\s*\%\}(.*?)(?:\{\%\s*elif\s+([^%]+)\s*\%\}(.*?))*(?:\{\%\s*else\s*\%\}(.*?))?\{\%\s*endif\s*\%\}'
-        
         def replace_conditional(match):
             condition = match.group(1).strip()
             content = match.group(2)
@@ -242,12 +250,10 @@ class EnhancedTemplateEngine:
             else:
                 return ""
         
-        return re.sub(pattern, replace_conditional, template_str, flags=re.DOTALL)
+        return _IF_BLOCK_RE.sub(replace_conditional, template_str)
     
     def _process_loops(self, template_str: str, context: Dict[str, Any]) -> str:
         """Process loop blocks like {% for item in items %}...{% endfor %}"""
-        pattern = r'\{\%\s*for\s+(\w+)\s+in\s+(\w+)\s*\%\}(.*?)\{\%\s*endfor\s*\%\}'
-        
         def replace_loop(match):
             var_name = match.group(1)
             list_name = match.group(2)
@@ -267,18 +273,16 @@ class EnhancedTemplateEngine:
             
             return '\n'.join(result)
         
-        return re.sub(pattern, replace_loop, template_str, flags=re.DOTALL)
+        return _FOR_BLOCK_RE.sub(replace_loop, template_str)
     
     def _process_includes(self, template_str: str, context: Dict[str, Any]) -> str:
         """Process include directives like {% include 'file.txt' %}"""
-        pattern = r'\{\%\s*include\s+[\'"]([^\'"]+)[\'"]\s*\%\}'
-        
         def replace_include(match):
             include_file = match.group(1)
             # For now, just return a placeholder
             return f"# Include: {include_file}"
         
-        return re.sub(pattern, replace_include, template_str)
+        return _INCLUDE_RE.sub(replace_include, template_str)
     
     def _evaluate_condition(self, condition: str, context: Dict[str, Any]) -> bool:
         """Evaluate a simple condition"""
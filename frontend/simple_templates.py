@@ -10,6 +10,16 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+# Markers of templates that need Jinja2 (loops, conditionals, filters)
+_COMPLEX_TEMPLATE_RES = (
+    re.compile(r'{%\s*(for|if|set|macro)'),  # Jinja2 control structures
+    re.compile(r'{{.*\|.*}}'),               # Jinja2 filters
+    re.compile(r'{%.*%}'),                   # Any Jinja2 statement
+)
+_SEPARATORS_RE = re.compile(r'[-\s]+')
+_NON_IDENTIFIER_RE = re.compile(r'[^a-z0-9_]')
+_WORD_SPLIT_RE = re.compile(r'[-_\s]+')
+
 
 class SimpleTemplateEngine:
     """Simple template engine using basic string substitution"""
@@ -48,16 +58,7 @@ class SimpleTemplateEngine:
     
     def _is_complex_template(self, template: str) -> bool:
         """Check if template needs Jinja2 (has loops, conditionals, etc.)"""
-        complex_patterns = [
-            r'{%\s*(for|if|set|macro)',  # Jinja2 control structures
-            r'{{.*\|.*}}',               # Jinja2 filters
-            r'{%.*%}',                   # Any Jinja2 statement
-        ]
-        
-        for pattern in complex_patterns:
-            if re.search(pattern, template):
-                return True
-        return False
+        return any(pattern.search(template) for pattern in _COMPLEX_TEMPLATE_RES)
     
     def _render_simple(self, template: str, context: Dict[str, Any]) -> str:
         """Simple template rendering using string substitution"""
@@ -126,9 +127,9 @@ class TemplateContext:
     def _to_package_name(self, name: str) -> str:
         """Convert project name to valid Python package name"""
         # Replace hyphens and spaces with underscores
-        package = re.sub(r'[-\s]+', '_', name.lower())
+        package = _SEPARATORS_RE.sub('_', name.lower())
         # Remove invalid characters
-        package = re.sub(r'[^a-z0-9_]', '', package)
+        package = _NON_IDENTIFIER_RE.sub('', package)
         # Ensure it doesn't start with a number
         if package and package[0].isdigit():
             package = f"project_{package}"
@@ -136,7 +137,7 @@ class TemplateContext:
     
     def _to_title_case(self, name: str) -> str:
         """Convert project name to title case"""
-        return ' '.join(word.capitalize() for word in re.split(r'[-_\s]+', name))
+        return ' '.join(word.capitalize() for word in _WORD_SPLIT_RE.split(name))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for template rendering"""
@@ -13,6 +13,8 @@ from datetime import datetime
 import tempfile
 import re
 
+from user_templates import UserTemplateManager
+
 # Handle optional PyYAML import
 try:
     import yaml
@@ -292,25 +294,10 @@ class TemplateManager:
         
         return True
     
-    def _load_registry(self) -> Dict[str, Any]:
-        """Load the template registry"""
-        registry_file = self.user_templates_dir / "registry.json"
-        if registry_file.exists():
-            with open(registry_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
-    
-    def _save_registry(self, registry: Dict[str, Any]) -> None:
-        """Save the template registry"""
-        registry_file = self.user_templates_dir / "registry.json"
-        with open(registry_file, 'w', encoding='utf-8') as f:
-            json.dump(registry, f, indent=2)
-    
     def _register_template(self, name: str, info: Dict[str, Any]) -> None:
         """Register a template in the registry"""
-        registry = self._load_registry()
-        registry[name] = info
-        self._save_registry(registry)
+        # The registry format is owned by UserTemplateManager
+        UserTemplateManager(self.user_templates_dir).register_template(name, info)
     
     def _enhance_source_directory(self, source_dir: Path, template_name: str, description: Optional[str]) -> None:
         """Enhance the source directory with Python project files"""
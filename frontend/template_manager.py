@@ -194,10 +194,8 @@ class IntegratedTemplateManager:
         """Generate project using built-in simple templates"""
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Generate project files using the existing system
-        project_files = self.project_generator.generate_project_structure(context)
-        
-        for file_path, content in project_files.items():
+        # Generate project files using the existing system, writing each as it is produced
+        for file_path, content in self.project_generator.iter_project_files(context):
             full_path = output_dir / file_path
             full_path.parent.mkdir(parents=True, exist_ok=True)
             
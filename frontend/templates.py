@@ -3,11 +3,11 @@ Template system for uvstart project generation
 Demonstrates Python's advanced template processing and project scaffolding capabilities
 """
 
-import re
 import os
+import sys
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Tuple
 from string import Template
 from datetime import datetime
 from dataclasses import dataclass
@@ -33,8 +33,14 @@ class TemplateContext:
         if self.features is None:
             self.features = []
     
+    @property
+    def feature_set(self) -> FrozenSet[str]:
+        """The selected features as a set, computed from the current features"""
+        return frozenset(self.features or ())
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for template substitution"""
+        feature_set = self.feature_set
         return {
             'project_name': self.project_name,
             'project_name_underscore': self.project_name.replace('-', '_'),
@@ -48,13 +54,72 @@ class TemplateContext:
             'backend': self.backend,
             'year': self.year,
             'features': self.features,
-            'has_cli': 'cli' in (self.features or []),
-            'has_web': 'web' in (self.features or []),
-            'has_notebook': 'notebook' in (self.features or []),
-            'has_pytorch': 'pytorch' in (self.features or [])
+            'has_cli': 'cli' in feature_set,
+            'has_web': 'web' in feature_set,
+            'has_notebook': 'notebook' in feature_set,
+            'has_pytorch': 'pytorch' in feature_set
         }
 
 
+# Opcodes for compiled templates
+_OP_TEXT = 0   # (_OP_TEXT, Template) - literal text with $var substitution
+_OP_IF = 1     # (_OP_IF, name, body)
+_OP_FOR = 2    # (_OP_FOR, item_var, list_var, body)
+
+# Loops over static sequences up to this length are unrolled at compile time
+_UNROLL_LIMIT = 8
+
+
+def _classify(words: List[str]) -> Tuple[Optional[str], Any]:
+    """Classify the words inside a {% ... %} directive"""
+    if not words:
+        return None, None
+    head = words[0]
+    first = head[0]
+    if first == 'i' and head == 'if':
+        if len(words) == 2 and words[1].isidentifier():
+            return 'if', sys.intern(words[1])
+    elif first == 'f' and head == 'for':
+        if (len(words) == 4 and words[2] == 'in'
+                and words[1].isidentifier() and words[3].isidentifier()):
+            return 'for', (sys.intern(words[1]), sys.intern(words[3]))
+    elif first == 'e' and len(words) == 1 and head in ('endif', 'endfor'):
+        return head, None
+    return None, None
+
+
+def _scan(src: str) -> Iterator[Tuple[str, Any, Tuple[int, int]]]:
+    """Split a template into literal text and {% ... %} directives.
+
+    Yields (kind, payload, span) tuples where kind is 'text', 'if', 'for',
+    'endif' or 'endfor'. Unrecognized directives, such as comparisons in
+    {% if %}, are passed through as text.
+    """
+    pos = 0
+    length = len(src)
+    while pos < length:
+        start = src.find('{%', pos)
+        if start < 0:
+            break
+        end = src.find('%}', start + 2)
+        if end < 0:
+            break
+        end += 2
+        
+        if start > pos:
+            yield 'text', src[pos:start], (pos, start)
+        
+        kind, payload = _classify(src[start + 2:end - 2].split())
+        if kind is None:
+            yield 'text', src[start:end], (start, end)
+        else:
+            yield kind, payload, (start, end)
+        pos = end
+    
+    if pos < length:
+        yield 'text', src[pos:], (pos, length)
+
+
 class SimpleTemplateEngine:
     """Simple template engine using Python's string.Template"""
     
@@ -63,15 +128,25 @@ class SimpleTemplateEngine:
     
     def render_string(self, template_str: str, context: Dict[str, Any]) -> str:
         """Render a template string with context variables"""
-        # Handle conditional blocks
-        processed = self._process_conditionals(template_str, context)
+        ops = self.template_cache.get(template_str)
+        if ops is None:
+            ops = self.template_cache[template_str] = self._compile(template_str)
         
-        # Handle loops
-        processed = self._process_loops(processed, context)
+        output: List[str] = []
+        self._execute(ops, context, output)
+        return ''.join(output)
+    
+    def render_specialized(self, template_str: str, context: Dict[str, Any],
+                           static: FrozenSet[Tuple[str, Any]]) -> str:
+        """Render a template with branches on the static (name, value) pairs folded away"""
+        key = (template_str, static)
+        ops = self.template_cache.get(key)
+        if ops is None:
+            ops = self.template_cache[key] = self._compile_specialized(template_str, static)
         
-        # Standard variable substitution
-        template = Template(processed)
-        return template.safe_substitute(context)
+        output: List[str] = []
+        self._execute(ops, context, output)
+        return ''.join(output)
     
     def render_file(self, template_path: Path, context: Dict[str, Any]) -> str:
         """Render a template file with context variables"""
@@ -83,49 +158,122 @@ class SimpleTemplateEngine:
         
         return self.render_string(template_content, context)
     
-    def _process_conditionals(self, template_str: str, context: Dict[str, Any]) -> str:
-        """Process conditional blocks like {% if condition %}...{% endif %}"""
-        # Simple if/endif processing
-        pattern = r'\{\%\s*if\s+(\w+)\s*\%\}(.*?)\{\%\s*endif\s*\%\}'
+    def _compile(self, template_str: str) -> List[tuple]:
+        """Compile a template into a nested list of opcodes"""
+        root: List[tuple] = []
+        ops = root
+        stack = []  # (block kind, enclosing ops, span)
         
-        def replace_conditional(match):
-            condition = match.group(1)
-            content = match.group(2)
-            
-            # Check if condition is true in context
-            if context.get(condition, False):
-                return content
+        for kind, payload, span in _scan(template_str):
+            if kind == 'text':
+                ops.append((_OP_TEXT, Template(payload)))
+            elif kind == 'if' or kind == 'for':
+                body: List[tuple] = []
+                if kind == 'if':
+                    ops.append((_OP_IF, payload, body))
+                else:
+                    ops.append((_OP_FOR, payload[0], payload[1], body))
+                stack.append((kind, ops, span))
+                ops = body
+            elif stack and 'end' + stack[-1][0] == kind:
+                ops = stack.pop()[1]
             else:
-                return ""
+                # An end directive without its block is left as literal text
+                ops.append((_OP_TEXT, Template(template_str[span[0]:span[1]])))
+        
+        if stack:
+            kind, _, span = stack[-1]
+            raise ValueError(f"Unclosed {{% {kind} %}} block at offset {span[0]}")
         
-        return re.sub(pattern, replace_conditional, template_str, flags=re.DOTALL)
+        return root
     
-    def _process_loops(self, template_str: str, context: Dict[str, Any]) -> str:
-        """Process loop blocks like {% for item in list %}...{% endfor %}"""
-        pattern = r'\{\%\s*for\s+(\w+)\s+in\s+(\w+)\s*\%\}(.*?)\{\%\s*endfor\s*\%\}'
+    def _compile_specialized(self, template_str: str,
+                             static: FrozenSet[Tuple[str, Any]]) -> List[tuple]:
+        """Compile a template, resolving conditionals on known values at compile time"""
+        return self._fold(self._compile(template_str), dict(static))
+    
+    def _fold(self, ops: List[tuple], known: Dict[str, Any]) -> List[tuple]:
+        """Inline or drop IF blocks whose condition is known, merging adjacent text"""
+        folded: List[tuple] = []
         
-        def replace_loop(match):
-            item_var = match.group(1)
-            list_var = match.group(2)
-            content = match.group(3)
-            
-            items = context.get(list_var, [])
-            if not isinstance(items, list):
-                return ""
-            
-            result = []
-            for item in items:
+        def emit(op):
+            if op[0] == _OP_TEXT and folded and folded[-1][0] == _OP_TEXT:
+                folded[-1] = (_OP_TEXT, Template(folded[-1][1].template + op[1].template))
+            else:
+                folded.append(op)
+        
+        for op in ops:
+            code = op[0]
+            if code == _OP_IF:
+                _, name, body = op
+                if name in known:
+                    if known[name]:
+                        for inner in self._fold(body, known):
+                            emit(inner)
+                else:
+                    emit((_OP_IF, name, self._fold(body, known)))
+            elif code == _OP_FOR:
+                _, item_var, list_var, body = op
+                items = known.get(list_var)
+                if isinstance(items, (list, tuple)) and len(items) <= _UNROLL_LIMIT:
+                    for item in items:
+                        for inner in self._fold(self._bind(body, item_var, item),
+                                                {**known, item_var: item}):
+                            emit(inner)
+                else:
+                    # The loop variable shadows any static value of the same name
+                    inner_known = {k: v for k, v in known.items() if k != item_var}
+                    emit((_OP_FOR, item_var, list_var, self._fold(body, inner_known)))
+            else:
+                emit(op)
+        
+        return folded
+    
+    def _bind(self, ops: List[tuple], name: str, value: Any) -> List[tuple]:
+        """Substitute a literal for $name in text ops, leaving other placeholders intact"""
+        literal = str(value).replace('$', '$$')
+        
+        def substitute(match):
+            if (match.group('named') or match.group('braced')) == name:
+                return literal
+            return match.group(0)
+        
+        bound: List[tuple] = []
+        for op in ops:
+            code = op[0]
+            if code == _OP_TEXT:
+                text = Template.pattern.sub(substitute, op[1].template)
+                bound.append((_OP_TEXT, Template(text)))
+            elif code == _OP_IF:
+                bound.append(op[:2] + (self._bind(op[2], name, value),))
+            elif op[1] == name:
+                # An inner loop rebinding the same name hides the outer value
+                bound.append(op)
+            else:
+                bound.append(op[:3] + (self._bind(op[3], name, value),))
+        return bound
+    
+    def _execute(self, ops: List[tuple], context: Dict[str, Any], output: List[str]) -> None:
+        """Run compiled opcodes against a context, appending to output"""
+        for op in ops:
+            code = op[0]
+            if code == _OP_TEXT:
+                output.append(op[1].safe_substitute(context))
+            elif code == _OP_IF:
+                _, name, body = op
+                if context.get(name, False):
+                    self._execute(body, context, output)
+            else:
+                _, item_var, list_var, body = op
+                items = context.get(list_var, [])
+                if not isinstance(items, list):
+                    continue
+                
                 # Create context with loop variable
                 loop_context = context.copy()
-                loop_context[item_var] = item
-                
-                # Simple substitution for loop content
-                loop_template = Template(content)
-                result.append(loop_template.safe_substitute(loop_context))
-            
-            return ''.join(result)
-        
-        return re.sub(pattern, replace_loop, template_str, flags=re.DOTALL)
+                for item in items:
+                    loop_context[item_var] = item
+                    self._execute(body, loop_context, output)
 
 
 class ProjectGenerator:
@@ -136,16 +284,8 @@ class ProjectGenerator:
     
     def generate_pyproject_toml(self, context: TemplateContext) -> str:
         """Generate pyproject.toml for different backends"""
-        ctx = context.to_dict()
-        
-        if context.backend == "uv":
-            return self._generate_uv_pyproject(ctx)
-        elif context.backend == "poetry":
-            return self._generate_poetry_pyproject(ctx)
-        elif context.backend == "pdm":
-            return self._generate_pdm_pyproject(ctx)
-        else:
-            return self._generate_generic_pyproject(ctx)
+        generator = self._BACKEND_DISPATCH.get(context.backend, type(self)._generate_generic_pyproject)
+        return generator(self, context.to_dict())
     
     def _generate_uv_pyproject(self, ctx: Dict[str, Any]) -> str:
         """Generate uv-specific pyproject.toml"""
@@ -253,16 +393,22 @@ build-backend = "setuptools.build_meta"
 '''
         return self.template_engine.render_string(template, ctx)
     
+    # Backend name -> pyproject generator; unknown backends use the generic one
+    _BACKEND_DISPATCH = {
+        'uv': _generate_uv_pyproject,
+        'poetry': _generate_poetry_pyproject,
+        'pdm': _generate_pdm_pyproject,
+    }
+    
     def generate_main_py(self, context: TemplateContext) -> str:
         """Generate main.py file"""
         ctx = context.to_dict()
+        feature_set = context.feature_set
         
-        if 'cli' in context.features:
-            return self._generate_cli_main(ctx)
-        elif 'web' in context.features:
-            return self._generate_web_main(ctx)
-        else:
-            return self._generate_simple_main(ctx)
+        for feature, generator in self._MAIN_DISPATCH:
+            if feature in feature_set:
+                return generator(self, ctx)
+        return self._generate_simple_main(ctx)
     
     def _generate_cli_main(self, ctx: Dict[str, Any]) -> str:
         """Generate CLI main.py"""
@@ -396,6 +542,12 @@ if __name__ == "__main__":
 '''
         return self.template_engine.render_string(template, ctx)
     
+    # Feature -> main.py generator, in priority order
+    _MAIN_DISPATCH = (
+        ('cli', _generate_cli_main),
+        ('web', _generate_web_main),
+    )
+    
     def generate_readme(self, context: TemplateContext) -> str:
         """Generate README.md"""
         ctx = context.to_dict()
@@ -472,25 +624,34 @@ $license
 
 $author <$email>
 '''
-        return self.template_engine.render_string(template, ctx)
+        # Feature flags and the feature list are fixed for a given context,
+        # so their branches and loops can be resolved at compile time
+        static = frozenset(
+            (key, value) for key, value in ctx.items() if isinstance(value, bool)
+        ) | {('features', tuple(context.features))}
+        return self.template_engine.render_specialized(template, ctx, static)
     
     def generate_project_structure(self, context: TemplateContext) -> Dict[str, str]:
         """Generate complete project structure"""
-        files = {}
-        
+        return dict(self.iter_project_files(context))
+    
+    def iter_project_files(self, context: TemplateContext) -> Iterator[Tuple[str, str]]:
+        """Yield (path, contents) pairs for the project one file at a time"""
         # Core files
-        files['pyproject.toml'] = self.generate_pyproject_toml(context)
-        files['main.py'] = self.generate_main_py(context)
-        files['README.md'] = self.generate_readme(context)
+        yield 'pyproject.toml', self.generate_pyproject_toml(context)
+        main_py = self.generate_main_py(context)
+        yield 'main.py', main_py
+        yield 'README.md', self.generate_readme(context)
         
         # Package structure
         pkg_name = context.project_name.replace('-', '_')
-        files[f'{pkg_name}/__init__.py'] = f'"""$project_name_title package"""\n\n__version__ = "{context.version}"\n'
-        files[f'{pkg_name}/main.py'] = self.generate_main_py(context)
+        title = context.project_name.replace('-', ' ').title()
+        yield f'{pkg_name}/__init__.py', f'"""{title} package"""\n\n__version__ = "{context.version}"\n'
+        yield f'{pkg_name}/main.py', main_py
         
         # Test structure
-        files['tests/__init__.py'] = ""
-        files[f'tests/test_{pkg_name}.py'] = f'''"""Tests for {context.project_name}"""
+        yield 'tests/__init__.py', ""
+        yield f'tests/test_{pkg_name}.py', f'''"""Tests for {context.project_name}"""
 
 import pytest
 from {pkg_name}.main import main
@@ -503,9 +664,7 @@ def test_main():
 '''
         
         # Additional files
-        files['.gitignore'] = self._generate_gitignore()
-        
-        return files
+        yield '.gitignore', self._generate_gitignore()
     
     def _generate_gitignore(self) -> str:
         """Generate .gitignore file"""
@@ -565,8 +724,7 @@ requirements.lock
 # Demo function
 def demo_template_system():
     """Demonstrate the template system capabilities"""
-    print("Template System Demo")
-    print("=" * 50)
+    parts = ["Template System Demo", "=" * 50]
     
     # Create context
     context = TemplateContext(
@@ -582,17 +740,17 @@ def demo_template_system():
     # Generate project
     generator = ProjectGenerator()
     
-    print("\nGenerated pyproject.toml:")
-    print("-" * 30)
-    print(generator.generate_pyproject_toml(context))
+    parts.extend(["\nGenerated pyproject.toml:", "-" * 30])
+    parts.append(generator.generate_pyproject_toml(context))
+    
+    parts.extend(["\nGenerated main.py:", "-" * 20])
+    parts.append(generator.generate_main_py(context))
     
-    print("\nGenerated main.py:")
-    print("-" * 20)
-    print(generator.generate_main_py(context))
+    parts.extend(["\nGenerated README.md:", "-" * 20])
+    parts.append(generator.generate_readme(context))
     
-    print("\nGenerated README.md:")
-    print("-" * 20)
-    print(generator.generate_readme(context))
+    # Emit everything in a single write
+    sys.stdout.write('\n'.join(parts) + '\n')
 
 
 if __name__ == "__main__":
@@ -4,21 +4,320 @@ Allows users to create, manage, and use custom templates in their local environm
 """
 
 import os
+import re
 import shutil
+import sys
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from string import Template
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass
+from contextlib import contextmanager
 from datetime import datetime
 
+# PyYAML is imported on first use so commands that never read or write
+# template YAML don't pay for it
+_yaml = None
+_HAS_YAML = None
+_Loader = None
+_Dumper = None
+
+
+def _get_yaml():
+    """Return the yaml module, importing it on first call (None if unavailable)"""
+    global _yaml, _HAS_YAML, _Loader, _Dumper
+    if _HAS_YAML is None:
+        try:
+            import yaml
+        except ImportError:
+            _HAS_YAML = False
+        else:
+            # Prefer the LibYAML C bindings when PyYAML was built with them
+            _Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            _Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            _yaml, _HAS_YAML = yaml, True
+    return _yaml
+
+
+# orjson is considerably faster for registry I/O; fall back to the stdlib
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+# registry.log is compacted into registry.json once it holds this many
+# records per live template
+_LOG_COMPACT_RATIO = 4
+
+
+def _apply_registry_record(registry: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Apply one registry.log record ({"op": "set"|"del", ...}) to a registry dict"""
+    op = record.get('op')
+    if op == 'set':
+        registry[record['name']] = record['info']
+    elif op == 'del':
+        registry.pop(record['name'], None)
+
+# zstd compresses and decompresses template archives much faster than gzip
 try:
-    import yaml
-    HAS_YAML = True
+    import zstandard as zstd
+    HAS_ZSTD = True
 except ImportError:
-    HAS_YAML = False
+    HAS_ZSTD = False
+
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+@contextmanager
+def _open_archive_for_write(output_path: Path) -> Iterator[Any]:
+    """Open a tar archive for writing, zstd-compressed when available.
+
+    The tar stream is written into a pipe and compressed on a background
+    thread, so directory traversal overlaps with compression.
+    """
+    import gzip
+    import tarfile
+    import threading
+    
+    read_fd, write_fd = os.pipe()
+    errors: List[BaseException] = []
+    
+    def compress() -> None:
+        try:
+            with os.fdopen(read_fd, 'rb') as src, open(output_path, 'wb') as dst:
+                if HAS_ZSTD:
+                    zstd.ZstdCompressor(level=3, threads=-1).copy_stream(src, dst)
+                else:
+                    with gzip.GzipFile(fileobj=dst, mode='wb') as gz:
+                        shutil.copyfileobj(src, gz)
+        except Exception as e:
+            errors.append(e)
+    
+    thread = threading.Thread(target=compress, daemon=True)
+    thread.start()
+    try:
+        with os.fdopen(write_fd, 'wb') as pipe, tarfile.open(fileobj=pipe, mode='w|') as tar:
+            yield tar
+    finally:
+        thread.join()
+        if errors:
+            raise errors[0]
+
+
+@contextmanager
+def _open_archive_for_read(archive_path: Path, is_zstd: bool) -> Iterator[Any]:
+    """Open a zstd- or gzip-compressed tar archive for sequential reading.
+
+    Decompression runs on a background thread feeding a pipe that the
+    tar reader consumes.
+    """
+    import gzip
+    import tarfile
+    import threading
+    
+    read_fd, write_fd = os.pipe()
+    errors: List[BaseException] = []
+    
+    def decompress() -> None:
+        try:
+            with open(archive_path, 'rb') as src, os.fdopen(write_fd, 'wb') as dst:
+                if is_zstd:
+                    zstd.ZstdDecompressor().copy_stream(src, dst)
+                else:
+                    with gzip.GzipFile(fileobj=src, mode='rb') as gz:
+                        shutil.copyfileobj(gz, dst)
+        except BrokenPipeError:
+            # The reader stopped before the end of the archive
+            pass
+        except Exception as e:
+            errors.append(e)
+    
+    thread = threading.Thread(target=decompress, daemon=True)
+    thread.start()
+    try:
+        with os.fdopen(read_fd, 'rb') as pipe, tarfile.open(fileobj=pipe, mode='r|') as tar:
+            yield tar
+    finally:
+        thread.join()
+        if errors:
+            # Report truncated or corrupt compressed data as a tar read error
+            raise tarfile.ReadError(f"cannot decompress {archive_path}: {errors[0]}") from errors[0]
+
+
+# Valid template names: ASCII identifiers of at most 64 characters
+_NAME_RE = re.compile(r'\A[A-Za-z_][A-Za-z0-9_]{0,63}\Z')
+
+# User template roots whose directory layout has already been created
+_ensured_roots: Set[Path] = set()
+
+
+def _parse_timestamp(value: Optional[str]) -> datetime:
+    """Parse an ISO timestamp from the registry; entries that predate
+    created_at/updated_at report the current time"""
+    return datetime.fromisoformat(value) if value else datetime.now()
+
+
+# template.yaml skeleton for new templates; create_template fills in the
+# per-template fields on a fresh copy
+_TEMPLATE_SKELETON_JSON = json.dumps({
+    'metadata': {
+        'name': '',
+        'description': '',
+        'category': '',
+        'version': '1.0.0',
+        'author': '',
+        'tags': [],
+        'dependencies': ['uv', 'poetry', 'pdm', 'rye', 'hatch'],
+        'features': [],
+        'min_python': '3.8',
+        'includes_ci': False,
+        'includes_docker': False,
+        'includes_tests': True,
+        'is_base_template': False
+    },
+    'requirements': {
+        'dependencies': [],
+        'dev_dependencies': [
+            'pytest>=7.0',
+            'black>=22.0',
+            'ruff>=0.1.0'
+        ]
+    },
+    'files': {
+        'generate': [
+            {
+                'path': '{{package_name}}/__init__.py',
+                'template': '__init__.py.j2'
+            },
+            {
+                'path': '{{package_name}}/main.py',
+                'template': 'main.py.j2'
+            },
+            {
+                'path': 'README.md',
+                'template': 'README.md.j2'
+            }
+        ]
+    }
+})
+
+# Extra template.yaml section for base templates
+_INHERITANCE_JSON = json.dumps({
+    'extendable_sections': [
+        'requirements.dependencies',
+        'requirements.dev_dependencies',
+        'files.generate'
+    ],
+    'merge_strategies': {
+        'requirements.dependencies': 'append',
+        'requirements.dev_dependencies': 'append',
+        'files.generate': 'append'
+    }
+})
+
+
+def _fast_copy_tree(src: Path, dst: Path, skip: Set[str] = frozenset()) -> None:
+    """Copy the contents of src into the existing directory dst.
+
+    Top-level names in skip are left out. File contents are copied with
+    shutil.copyfile, so metadata such as mtimes is not preserved.
+    """
+    with os.scandir(src) as it:
+        for entry in it:
+            if entry.name in skip:
+                continue
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                os.mkdir(target)
+                _fast_copy_tree(Path(entry.path), Path(target))
+            else:
+                shutil.copyfile(entry.path, target)
+
+
+# Starter files for new templates. Only $description is filled in
+# here; the {{ ... }} tokens are left for Jinja at generation time.
+_INIT_TMPL = Template('''"""
+$description
+"""
+
+__version__ = "{{ version }}"
+__author__ = "{{ author }}"
+''')
+
+_MAIN_TMPL = Template('''"""
+$description
+"""
+
+from __future__ import annotations
+
+
+def main() -> None:
+    """Main function for {{ project_name_title }}"""
+    print("Hello from {{ project_name_title }}!")
+    print("Description: {{ description }}")
+
+
+if __name__ == "__main__":
+    main()
+''')
+
+_README_TMPL = Template('''# {{ project_name_title }}
+
+{{ description }}
+
+## Installation
+
+```bash
+{{ backend }} sync
+```
+
+## Usage
+
+```bash
+{{ backend }} run python main.py
+```
+
+## Development
+
+```bash
+# Install development dependencies
+{{ backend }} sync --group dev
+
+# Run tests
+{{ backend }} run pytest
+
+# Format code
+{{ backend }} run black .
+
+# Lint code
+{{ backend }} run ruff check .
+```
+
+## License
+
+{{ license }}
+
+## Author
+
+{{ author }} <{{ email }}>
+''')
+
+
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class UserTemplate:
     """Represents a user-created template"""
     name: str
@@ -37,17 +336,33 @@ class UserTemplateManager:
     
     def __init__(self, user_templates_dir: Optional[Path] = None):
         self.user_templates_dir = user_templates_dir or self._get_default_user_templates_dir()
-        self.user_templates_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize subdirectories
-        (self.user_templates_dir / "templates").mkdir(exist_ok=True)
-        (self.user_templates_dir / "templates" / "features").mkdir(exist_ok=True)
-        (self.user_templates_dir / "templates" / "base").mkdir(exist_ok=True)
-        (self.user_templates_dir / "backups").mkdir(exist_ok=True)
+        # Initialize subdirectories (once per root per process)
+        if self.user_templates_dir not in _ensured_roots:
+            for subdir in (("templates", "features"), ("templates", "base"), ("backups",)):
+                path = self.user_templates_dir.joinpath(*subdir)
+                if not os.path.isdir(path):
+                    os.makedirs(path, exist_ok=True)
+            _ensured_roots.add(self.user_templates_dir)
         
         self.registry_file = self.user_templates_dir / "registry.json"
+        self.registry_log = self.user_templates_dir / "registry.log"
         self.config_file = self.user_templates_dir / "config.yaml"
         
+        system_templates_dir = Path(__file__).parent.parent / "templates"
+        self._search_roots = (
+            self.user_templates_dir / "templates" / "features",
+            self.user_templates_dir / "templates" / "base",
+            system_templates_dir / "features",
+            system_templates_dir / "base",
+        )
+        
+        # Parsed registry (registry.json plus replayed log), reused until
+        # either file changes on disk
+        self._registry: Optional[Dict[str, Any]] = None
+        self._registry_state = (-1, -1)
+        self._log_records = 0
+        
         self._load_or_create_config()
     
     def _get_default_user_templates_dir(self) -> Path:
@@ -65,60 +380,100 @@ class UserTemplateManager:
     
     def _load_or_create_config(self) -> None:
         """Load or create user template configuration"""
-        if self.config_file.exists() and HAS_YAML:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f) or {}
-        else:
-            # Default configuration
-            self.config = {
-                'version': '1.0.0',
-                'auto_backup': True,
-                'max_backups': 10,
-                'default_author': os.environ.get('USER', 'Unknown'),
-                'default_license': 'MIT',
-                'template_validation': True,
-                'sync_with_git': False,
-                'git_repository': '',
-                'categories': [
-                    'application',
-                    'web',
-                    'data-science', 
-                    'machine-learning',
-                    'cloud-native',
-                    'custom'
-                ]
-            }
-            self._save_config()
+        if self.config_file.exists():
+            # Reuse the JSON sidecar if config.yaml hasn't changed since it was written
+            st = self.config_file.stat()
+            cache_key = [st.st_mtime_ns, st.st_size]
+            cache_file = self.config_file.with_suffix('.yaml.cache.json')
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached.get('_key') == cache_key:
+                    self.config = cached['data']
+                    return
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+            
+            yaml = _get_yaml()
+            if yaml:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    self.config = yaml.load(f, Loader=_Loader) or {}
+                self._write_config_cache(cache_file, cache_key)
+                return
+        
+        # Default configuration
+        self.config = {
+            'version': '1.0.0',
+            'auto_backup': True,
+            'max_backups': 10,
+            'default_author': os.environ.get('USER', 'Unknown'),
+            'default_license': 'MIT',
+            'template_validation': True,
+            'sync_with_git': False,
+            'git_repository': '',
+            'categories': [
+                'application',
+                'web',
+                'data-science', 
+                'machine-learning',
+                'cloud-native',
+                'custom'
+            ]
+        }
+        self._save_config()
+    
+    def _write_config_cache(self, cache_file: Path, cache_key: List[int]) -> None:
+        """Write the parsed config to its JSON sidecar, replacing it atomically"""
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'_key': cache_key, 'data': self.config}, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            # Config values that JSON can't represent just mean no cache
+            tmp_file.unlink(missing_ok=True)
     
     def _save_config(self) -> None:
         """Save configuration to file"""
-        if HAS_YAML:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False)
+        yaml = _get_yaml()
+        if yaml:
+            target = self.config_file
+            data = yaml.dump(self.config, Dumper=_Dumper, default_flow_style=False).encode('utf-8')
         else:
             # Fallback to JSON if YAML not available
-            with open(self.config_file.with_suffix('.json'), 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            target = self.config_file.with_suffix('.json')
+            data = _json_dumps(self.config)
+        
+        # Write beside the target and rename so readers never see a partial file
+        tmp_file = target.with_name(target.name + '.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, target)
     
     def list_user_templates(self) -> List[UserTemplate]:
         """List all user-created templates"""
         registry = self._load_registry()
         templates = []
         
+        # One scan per directory; feature templates shadow base templates of the same name
+        present: Dict[str, Path] = {}
+        for subdir in ("base", "features"):
+            try:
+                with os.scandir(self.user_templates_dir / "templates" / subdir) as it:
+                    present.update((entry.name, Path(entry.path)) for entry in it)
+            except FileNotFoundError:
+                pass
+        
         for template_name, template_info in registry.items():
-            template_path = self.user_templates_dir / "templates" / "features" / template_name
-            if not template_path.exists():
-                template_path = self.user_templates_dir / "templates" / "base" / template_name
-            
-            if template_path.exists():
+            template_path = present.get(template_name)
+            if template_path is not None:
                 templates.append(UserTemplate(
                     name=template_name,
                     description=template_info.get('description', ''),
-                    category=template_info.get('category', 'custom'),
-                    author=template_info.get('author', 'Unknown'),
-                    version=template_info.get('version', '1.0.0'),
-                    created_at=datetime.fromisoformat(template_info.get('created_at', datetime.now().isoformat())),
-                    updated_at=datetime.fromisoformat(template_info.get('updated_at', datetime.now().isoformat())),
+                    category=sys.intern(str(template_info.get('category', 'custom'))),
+                    author=sys.intern(str(template_info.get('author', 'Unknown'))),
+                    version=sys.intern(str(template_info.get('version', '1.0.0'))),
+                    created_at=_parse_timestamp(template_info.get('created_at')),
+                    updated_at=_parse_timestamp(template_info.get('updated_at')),
                     path=template_path,
                     is_active=template_info.get('is_active', True)
                 ))
@@ -129,8 +484,9 @@ class UserTemplateManager:
                        is_base_template: bool = False, copy_from: Optional[str] = None) -> Path:
         """Create a new user template"""
         # Validate template name
-        if not name.isidentifier():
-            raise ValueError(f"Template name '{name}' is not a valid identifier")
+        if not _NAME_RE.match(name):
+            raise ValueError(f"Template name '{name}' must be at most 64 ASCII letters, digits and "
+                             "underscores, and must not start with a digit")
         
         # Determine template path
         template_dir = "base" if is_base_template else "features"
@@ -147,89 +503,42 @@ class UserTemplateManager:
             source_template = self._find_template_path(copy_from)
             if source_template and source_template.exists():
                 # Copy all files except template.yaml (we'll create a new one)
-                for item in source_template.iterdir():
-                    if item.name != 'template.yaml':
-                        if item.is_dir():
-                            shutil.copytree(item, template_path / item.name)
-                        else:
-                            shutil.copy2(item, template_path)
-        
-        # Create template.yaml configuration
-        template_config = {
-            'metadata': {
-                'name': name,
-                'description': description,
-                'category': category,
-                'version': '1.0.0',
-                'author': self.config.get('default_author', 'Unknown'),
-                'tags': [category, 'user-created'],
-                'dependencies': ['uv', 'poetry', 'pdm', 'rye', 'hatch'],
-                'features': [name],
-                'min_python': '3.8',
-                'includes_ci': False,
-                'includes_docker': False,
-                'includes_tests': True,
-                'is_base_template': is_base_template
-            },
-            'requirements': {
-                'dependencies': [],
-                'dev_dependencies': [
-                    'pytest>=7.0',
-                    'black>=22.0',
-                    'ruff>=0.1.0'
-                ]
-            },
-            'files': {
-                'generate': [
-                    {
-                        'path': '{{package_name}}/__init__.py',
-                        'template': '__init__.py.j2'
-                    },
-                    {
-                        'path': '{{package_name}}/main.py',
-                        'template': 'main.py.j2'
-                    },
-                    {
-                        'path': 'README.md',
-                        'template': 'README.md.j2'
-                    }
-                ]
-            },
-            'hooks': {
-                'pre_generate': [
-                    f"echo 'Generating {name} project...'"
-                ],
-                'post_generate': [
-                    f"echo '{name} project generated successfully!'"
-                ]
-            }
+                _fast_copy_tree(source_template, template_path, skip={'template.yaml'})
+        
+        # Create template.yaml configuration from the shared skeleton
+        template_config = json.loads(_TEMPLATE_SKELETON_JSON)
+        metadata = template_config['metadata']
+        metadata['name'] = name
+        metadata['description'] = description
+        metadata['category'] = category
+        metadata['author'] = self.config.get('default_author', 'Unknown')
+        metadata['tags'] = [category, 'user-created']
+        metadata['features'] = [name]
+        metadata['is_base_template'] = is_base_template
+        template_config['hooks'] = {
+            'pre_generate': [
+                f"echo 'Generating {name} project...'"
+            ],
+            'post_generate': [
+                f"echo '{name} project generated successfully!'"
+            ]
         }
         
         if is_base_template:
-            template_config['inheritance'] = {
-                'extendable_sections': [
-                    'requirements.dependencies',
-                    'requirements.dev_dependencies',
-                    'files.generate'
-                ],
-                'merge_strategies': {
-                    'requirements.dependencies': 'append',
-                    'requirements.dev_dependencies': 'append',
-                    'files.generate': 'append'
-                }
-            }
+            template_config['inheritance'] = json.loads(_INHERITANCE_JSON)
         
         # Write template configuration
         config_file = template_path / 'template.yaml'
-        if HAS_YAML:
+        yaml = _get_yaml()
+        if yaml:
             with open(config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(template_config, f, default_flow_style=False)
+                yaml.dump(template_config, f, Dumper=_Dumper, default_flow_style=False)
         
         # Create basic template files
         self._create_basic_template_files(template_path, name, description)
         
         # Register template
-        self._register_template(name, {
+        self.register_template(name, {
             'description': description,
             'category': category,
             'author': self.config.get('default_author', 'Unknown'),
@@ -245,101 +554,30 @@ class UserTemplateManager:
     
     def _create_basic_template_files(self, template_path: Path, name: str, description: str) -> None:
         """Create basic template files for a new template"""
-        # Create __init__.py.j2
-        init_template = template_path / '__init__.py.j2'
-        with open(init_template, 'w', encoding='utf-8') as f:
-            f.write(f'''"""
-{description}
-"""
-
-__version__ = "{{{{ version }}}}"
-__author__ = "{{{{ author }}}}"
-''')
-        
-        # Create main.py.j2
-        main_template = template_path / 'main.py.j2'
-        with open(main_template, 'w', encoding='utf-8') as f:
-            f.write(f'''"""
-{description}
-"""
-
-from __future__ import annotations
-
-
-def main() -> None:
-    """Main function for {{{{ project_name_title }}}}"""
-    print("Hello from {{{{ project_name_title }}}}!")
-    print("Description: {{{{ description }}}}")
-
-
-if __name__ == "__main__":
-    main()
-''')
-        
-        # Create README.md.j2
-        readme_template = template_path / 'README.md.j2'
-        with open(readme_template, 'w', encoding='utf-8') as f:
-            f.write(f'''# {{{{ project_name_title }}}}
-
-{{{{ description }}}}
-
-## Installation
-
-```bash
-{{{{ backend }}}} sync
-```
-
-## Usage
-
-```bash
-{{{{ backend }}}} run python main.py
-```
-
-## Development
-
-```bash
-# Install development dependencies
-{{{{ backend }}}} sync --group dev
-
-# Run tests
-{{{{ backend }}}} run pytest
-
-# Format code
-{{{{ backend }}}} run black .
-
-# Lint code
-{{{{ backend }}}} run ruff check .
-```
-
-## License
-
-{{{{ license }}}}
-
-## Author
-
-{{{{ author }}}} <{{{{ email }}}}>
-''')
+        for filename, template in (
+            ('__init__.py.j2', _INIT_TMPL),
+            ('main.py.j2', _MAIN_TMPL),
+            ('README.md.j2', _README_TMPL),
+        ):
+            body = template.substitute(description=description)
+            (template_path / filename).write_bytes(body.encode('utf-8'))
     
     def _find_template_path(self, template_name: str) -> Optional[Path]:
         """Find the path to an existing template"""
-        # Check user templates first
-        user_feature_path = self.user_templates_dir / "templates" / "features" / template_name
-        if user_feature_path.exists():
-            return user_feature_path
-        
-        user_base_path = self.user_templates_dir / "templates" / "base" / template_name
-        if user_base_path.exists():
-            return user_base_path
+        user_features, user_base = self._search_roots[:2]
         
-        # Check system templates
-        system_templates_dir = Path(__file__).parent.parent / "templates"
-        system_feature_path = system_templates_dir / "features" / template_name
-        if system_feature_path.exists():
-            return system_feature_path
+        # A template already known to the registry only needs its own root checked
+        info = self._registry.get(template_name) if self._registry is not None else None
+        if info is not None:
+            path = (user_base if info.get('is_base_template') else user_features) / template_name
+            if os.path.isdir(path):
+                return path
         
-        system_base_path = system_templates_dir / "base" / template_name
-        if system_base_path.exists():
-            return system_base_path
+        # User templates shadow system templates, features before base
+        for root in self._search_roots:
+            path = root / template_name
+            if os.path.exists(path):
+                return path
         
         return None
     
@@ -361,10 +599,8 @@ if __name__ == "__main__":
         shutil.rmtree(template_path)
         
         # Unregister template
-        registry = self._load_registry()
-        if name in registry:
-            del registry[name]
-            self._save_registry(registry)
+        if name in self._load_registry():
+            self._append_registry_log({'op': 'del', 'name': name})
         
         print(f"Template '{name}' deleted successfully")
         return True
@@ -380,96 +616,215 @@ if __name__ == "__main__":
         # Clean up old backups if max_backups is set
         max_backups = self.config.get('max_backups', 10)
         if max_backups > 0:
-            backups = sorted([p for p in backup_dir.iterdir() if p.name.startswith(f"{name}_")],
-                           key=lambda x: x.stat().st_mtime)
+            prefix = f"{name}_"
+            with os.scandir(backup_dir) as it:
+                backups = [entry for entry in it if entry.name.startswith(prefix)]
+            backups.sort(key=lambda entry: entry.stat().st_mtime)
             while len(backups) > max_backups:
-                shutil.rmtree(backups.pop(0))
+                shutil.rmtree(backups.pop(0).path)
+    
+    def _get_registry_state(self) -> Tuple[int, int]:
+        """Return (registry.json mtime, registry.log size), -1 for missing files"""
+        try:
+            json_mtime = self.registry_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            json_mtime = -1
+        try:
+            log_size = self.registry_log.stat().st_size
+        except FileNotFoundError:
+            log_size = -1
+        return json_mtime, log_size
     
     def _load_registry(self) -> Dict[str, Any]:
         """Load the template registry"""
-        if self.registry_file.exists():
-            with open(self.registry_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
+        state = self._get_registry_state()
+        if self._registry is not None and state == self._registry_state:
+            return self._registry
+        
+        registry = _json_loads(self.registry_file.read_bytes()) if state[0] >= 0 else {}
+        
+        # Replay changes appended since the last compaction
+        self._log_records = 0
+        if state[1] > 0:
+            with open(self.registry_log, 'rb') as f:
+                for line in f:
+                    try:
+                        record = _json_loads(line)
+                    except ValueError:
+                        # Torn line from an interrupted append
+                        continue
+                    _apply_registry_record(registry, record)
+                    self._log_records += 1
+        
+        self._registry = registry
+        self._registry_state = state
+        return registry
     
     def _save_registry(self, registry: Dict[str, Any]) -> None:
-        """Save the template registry"""
-        with open(self.registry_file, 'w', encoding='utf-8') as f:
-            json.dump(registry, f, indent=2)
+        """Save the full template registry and clear the change log"""
+        # Atomic rename instead of truncate-and-write; no fsync, the registry
+        # can be rebuilt and doesn't warrant a disk barrier per change
+        tmp_file = self.registry_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(_json_dumps(registry))
+        os.replace(tmp_file, self.registry_file)
+        
+        # registry.json now holds every logged change
+        self.registry_log.unlink(missing_ok=True)
+        
+        self._registry = registry
+        self._registry_state = self._get_registry_state()
+        self._log_records = 0
     
-    def _register_template(self, name: str, info: Dict[str, Any]) -> None:
-        """Register a template in the registry"""
+    def _append_registry_log(self, record: Dict[str, Any]) -> None:
+        """Record a registry change by appending one line to the change log"""
         registry = self._load_registry()
-        registry[name] = info
-        self._save_registry(registry)
+        line = _json_dumps(record, indent=False) + b'\n'
+        with open(self.registry_log, 'a+b') as f:
+            # Start a fresh line if an earlier append was cut short
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    line = b'\n' + line
+            f.write(line)
+        
+        _apply_registry_record(registry, record)
+        self._registry_state = self._get_registry_state()
+        self._log_records += 1
+        
+        # Fold the log back into registry.json once it outgrows the live registry
+        if self._log_records > _LOG_COMPACT_RATIO * max(len(registry), 1):
+            self._save_registry(registry)
+    
+    def register_template(self, name: str, info: Dict[str, Any]) -> None:
+        """Register a template in the registry"""
+        self._append_registry_log({'op': 'set', 'name': name, 'info': info})
     
     def export_template(self, name: str, output_path: Path) -> bool:
-        """Export a template to a tar.gz file"""
+        """Export a template to a tar.zst file (tar.gz without zstandard)"""
         template_path = self._find_template_path(name)
         if not template_path:
             return False
         
-        import tarfile
-        
-        with tarfile.open(output_path, 'w:gz') as tar:
+        if HAS_ZSTD:
+            # zstd archives get their own extension so the format is obvious
+            archive_name = output_path.name
+            for suffix in ('.tar.gz', '.tgz'):
+                if archive_name.endswith(suffix):
+                    archive_name = archive_name[:-len(suffix)]
+            if not archive_name.endswith('.tar.zst'):
+                archive_name += '.tar.zst'
+            output_path = output_path.with_name(archive_name)
+        
+        with _open_archive_for_write(output_path) as tar:
             tar.add(template_path, arcname=name)
         
         print(f"Template '{name}' exported to {output_path}")
         return True
     
     def import_template(self, archive_path: Path, name: Optional[str] = None) -> bool:
-        """Import a template from a tar.gz file"""
+        """Import a template from a tar.gz or tar.zst file"""
         import tarfile
         
-        with tarfile.open(archive_path, 'r:gz') as tar:
-            # Extract to temporary directory first
-            temp_dir = self.user_templates_dir / "temp"
-            temp_dir.mkdir(exist_ok=True)
-            
-            try:
-                tar.extractall(temp_dir)
-                
-                # Find the extracted template directory
-                extracted_dirs = [d for d in temp_dir.iterdir() if d.is_dir()]
-                if not extracted_dirs:
+        with open(archive_path, 'rb') as f:
+            is_zstd = f.read(4) == _ZSTD_MAGIC
+        if is_zstd and not HAS_ZSTD:
+            print(f"Cannot import {archive_path}: install 'zstandard' to read .tar.zst archives")
+            return False
+        
+        features_dir = self.user_templates_dir / "templates" / "features"
+        staging_path = None
+        try:
+            with _open_archive_for_read(archive_path, is_zstd) as tar:
+                # The archive's top-level directory names the template
+                first = tar.next()
+                if first is None:
+                    return False
+                first_parts = [p for p in first.name.split('/') if p not in ('', '.')]
+                if not first_parts or (len(first_parts) == 1 and not first.isdir()):
                     return False
                 
-                template_dir = extracted_dirs[0]
-                template_name = name or template_dir.name
-                
-                # Move to final location
-                final_path = self.user_templates_dir / "templates" / "features" / template_name
-                if final_path.exists():
-                    shutil.rmtree(final_path)
+                root = first_parts[0]
+                template_name = name or root
+                final_path = features_dir / template_name
                 
-                shutil.move(str(template_dir), str(final_path))
+                # Extract next to the final location, on the same filesystem, and only
+                # swap it in once the whole archive has been read; an existing template
+                # stays untouched if the archive turns out to be truncated or corrupt
+                staging_name = f".{template_name}.importing"
+                staging_path = features_dir / staging_name
+                if staging_path.exists():
+                    shutil.rmtree(staging_path)
+                staging_path.mkdir(parents=True)
+                staging_root = staging_path.resolve()
                 
-                # Register template
-                config_file = final_path / 'template.yaml'
-                if config_file.exists() and HAS_YAML:
-                    with open(config_file, 'r', encoding='utf-8') as f:
-                        config = yaml.safe_load(f)
+                # Stream the members out, renaming the top-level directory as we go
+                extract_kwargs = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+                template_meta = None
+                for member in tar:
+                    parts = [p for p in member.name.split('/') if p not in ('', '.')]
+                    if not parts or parts[0] != root:
+                        continue
+                    if not extract_kwargs and (member.issym() or member.islnk()):
+                        continue
                     
-                    metadata = config.get('metadata', {})
-                    self._register_template(template_name, {
-                        'description': metadata.get('description', ''),
-                        'category': metadata.get('category', 'custom'),
-                        'author': metadata.get('author', 'Unknown'),
-                        'version': metadata.get('version', '1.0.0'),
-                        'created_at': datetime.now().isoformat(),
-                        'updated_at': datetime.now().isoformat(),
-                        'is_active': True
-                    })
-                
-                print(f"Template '{template_name}' imported successfully")
-                return True
+                    member.name = '/'.join([staging_name] + parts[1:])
+                    target = (features_dir / member.name).resolve()
+                    if target != staging_root and staging_root not in target.parents:
+                        continue
+                    
+                    if len(parts) == 2 and parts[1] == 'template.yaml' and member.isfile():
+                        # Keep the config bytes for registration instead of re-reading it;
+                        # a streamed member can only be read once, so write it ourselves
+                        template_meta = tar.extractfile(member).read()
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        target.write_bytes(template_meta)
+                        os.chmod(target, (member.mode & 0o755) | 0o600)
+                        os.utime(target, (member.mtime, member.mtime))
+                        continue
+                    
+                    tar.extract(member, features_dir, **extract_kwargs)
             
-            finally:
-                # Clean up temporary directory
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            # Move any previous version aside so the new tree can be renamed into place
+            old_path = None
+            if final_path.exists():
+                old_path = features_dir / f".{template_name}.old"
+                if old_path.exists():
+                    shutil.rmtree(old_path)
+                os.replace(final_path, old_path)
+            try:
+                os.replace(staging_path, final_path)
+            except OSError:
+                if old_path is not None:
+                    os.replace(old_path, final_path)
+                raise
+            staging_path = None
+            if old_path is not None:
+                shutil.rmtree(old_path, ignore_errors=True)
+        except (tarfile.TarError, OSError) as e:
+            print(f"Failed to import template from {archive_path}: {e}")
+            return False
+        finally:
+            if staging_path is not None:
+                shutil.rmtree(staging_path, ignore_errors=True)
         
-        return False
-
+        # Register template
+        yaml = _get_yaml() if template_meta is not None else None
+        if yaml:
+            config = yaml.load(template_meta, Loader=_Loader) or {}
+            
+            metadata = config.get('metadata', {})
+            self.register_template(template_name, {
+                'description': metadata.get('description', ''),
+                'category': metadata.get('category', 'custom'),
+                'author': metadata.get('author', 'Unknown'),
+                'version': metadata.get('version', '1.0.0'),
+                'created_at': datetime.now().isoformat(),
+                'updated_at': datetime.now().isoformat(),
+                'is_active': True
+            })
+        
+        print(f"Template '{template_name}' imported successfully")
+        return True
 
 def demo_user_templates():
     """Demonstrate user template management"""
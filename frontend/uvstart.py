@@ -5,25 +5,120 @@ Enhanced with isolated environment and configuration management
 """
 
 import argparse
+import atexit
+import functools
+import re
 import subprocess
 import sys
 import os
 import json
 import shutil
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
-# Import our modules
-from config_manager import get_config
-from simple_templates import SimpleTemplateManager, TemplateContext
+# Our own modules (config_manager and the template stack) are imported
+# where they are used, so engine, doctor and update commands don't pay for
+# them at startup
 
-# Try to import enhanced features (optional)
-try:
-    from template_commands import TemplateManager
-    ENHANCED_TEMPLATES = True
-except ImportError:
-    ENHANCED_TEMPLATES = False
+@functools.lru_cache(maxsize=None)
+def _enhanced_templates() -> bool:
+    """Whether the enhanced template system (optional) can be imported"""
+    try:
+        import template_commands  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _integrated_manager():
+    """The template manager that knows about user templates, shared by
+    feature validation and project generation (raises ImportError when the
+    enhanced template system is unavailable)"""
+    from template_manager import IntegratedTemplateManager
+    return IntegratedTemplateManager()
+
+
+class _FeatureChoices:
+    """Feature names accepted by --features, listed on first use"""
+    
+    def __init__(self):
+        self._names: Optional[List[str]] = None
+    
+    def _load(self) -> List[str]:
+        if self._names is None:
+            names = list(_BASIC_FEATURES)
+            if _enhanced_templates():
+                try:
+                    from template_commands import TemplateManager
+                    names = [t.name for t in TemplateManager().list_templates()]
+                except Exception:
+                    pass  # Fall back to basic features
+            self._names = names
+        return self._names
+    
+    def __contains__(self, name) -> bool:
+        return name in self._load()
+    
+    def __iter__(self):
+        return iter(self._load())
+
+
+# PATH lookups are repeated for the same tools across validation and
+# doctor checks; PATH does not change during a CLI run
+_which = functools.lru_cache(maxsize=256)(shutil.which)
+
+
+def _run(cmd, **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run() capturing text output, with close_fds=False
+    
+    Descriptors Python opens are non-inheritable (PEP 446), so closing
+    them in the child gains nothing; leaving close_fds off lets CPython
+    start a command given by path with posix_spawn() when no cwd is set.
+    """
+    kwargs.setdefault("capture_output", True)
+    kwargs.setdefault("text", True)
+    return subprocess.run(cmd, close_fds=False, **kwargs)
+
+# Features that are always available, even without the template manager
+_BASIC_FEATURES = ("cli", "web", "notebook", "pytorch")
+
+# Backends generate/init accept, in the order --help lists them
+_BACKEND_CHOICES = ("uv", "poetry", "pdm")
+
+# Backends a project can be initialized with, and how to install each
+_BACKEND_INSTALL_CMDS: Dict[str, str] = {
+    "pdm": "curl -sSL https://pdm-project.org/install-pdm.py | python3 -",
+    "uv": "curl -LsSf https://astral.sh/uv/install.sh | sh",
+    "poetry": "curl -sSL https://install.python-poetry.org | python3 -"
+}
+
+_VERSION_RE = re.compile(r'[0-9]+\.[0-9]+(?:\.[0-9]+)?')
+_PY_VERSION_RE = re.compile(r'^3\.\d+$')
+_PY_VERSIONED_CMD_RE = re.compile(r'^python3\.(\d+)$')
+_GIT_SHA_RE = re.compile(r'^[0-9a-f]{40}(?:[0-9a-f]{24})?$')
+
+
+# Engine commands that only read project state; their results are reused
+_READ_ONLY_COMMANDS = frozenset({"detect", "backends", "info", "version", "install-cmd", "clean-files"})
+
+# Engine commands that may change project state and invalidate cached results
+_MUTATING_COMMANDS = frozenset({"add", "remove", "sync", "run", "clean"})
+
+# How long to wait for the persistent engine to answer one request
+_DAEMON_REPLY_TIMEOUT = 10
+
+# Engines with a running persistent process, shut down together at exit
+_engines_with_daemon: "weakref.WeakSet[UVStartEngine]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_engine_daemons() -> None:
+    """Shut down every persistent engine process still running"""
+    for engine in list(_engines_with_daemon):
+        engine._close_daemon()
 
 
 class UVStartEngine:
@@ -37,18 +132,135 @@ class UVStartEngine:
         
         if not self.engine_path.exists():
             raise RuntimeError(f"Engine not found at {self.engine_path}")
+        
+        # Results of read-only engine commands, keyed by command and project path
+        self._cache: Dict[Tuple[str, ...], subprocess.CompletedProcess] = {}
+        
+        # Long-lived engine process serving captured commands (see _run_engine)
+        self._daemon: Optional[subprocess.Popen] = None
+        self._daemon_supported = True
+        self._daemon_buffer = b""
+        self._captured_runs = 0
     
-    def _run_engine(self, command: List[str]) -> subprocess.CompletedProcess:
-        """Run the C++ engine with given command"""
+    def _engine_command(self, command: List[str]) -> List[str]:
+        """Build the full engine command line"""
         full_command = [str(self.engine_path)] + command
         if self.project_path != ".":
             full_command.extend(["--path", self.project_path])
+        return full_command
+    
+    def _run_engine(self, command: List[str]) -> subprocess.CompletedProcess:
+        """Run the C++ engine with given command, capturing its output"""
+        key = (*command, self.project_path)
+        read_only = command[0] in _READ_ONLY_COMMANDS
+        if read_only and key in self._cache:
+            return self._cache[key]
+        
+        full_command = self._engine_command(command)
+        # A one-off query is cheaper as a plain process; the persistent
+        # engine only pays off from the second query on
+        self._captured_runs += 1
+        result = self._request_daemon(full_command) if self._captured_runs > 1 else None
+        if result is None:
+            result = _run(full_command)
+        
+        if read_only:
+            self._cache[key] = result
+        elif command[0] in _MUTATING_COMMANDS:
+            self._cache.clear()
+        return result
+    
+    def _request_daemon(self, full_command: List[str]) -> Optional[subprocess.CompletedProcess]:
+        """Run a command through the persistent engine process
+        
+        The engine is started once with --daemon and then answers one JSON
+        request per line, so repeated queries don't each fork and exec it.
+        Returns None when the engine doesn't support this or stops
+        answering, in which case the caller runs the command as a separate
+        process.
+        """
+        if self._daemon is None:
+            if not self._daemon_supported:
+                return None
+            try:
+                # stderr is inherited so engine diagnostics stay visible
+                self._daemon = subprocess.Popen(
+                    [str(self.engine_path), "--daemon"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    close_fds=False
+                )
+            except OSError:
+                self._daemon_supported = False
+                return None
+            self._daemon_buffer = b""
+            _engines_with_daemon.add(self)
         
-        return subprocess.run(
-            full_command,
-            capture_output=True,
-            text=True
-        )
+        try:
+            request = json.dumps({"cmd": full_command[1:]}).encode("utf-8") + b"\n"
+            self._daemon.stdin.write(request)
+            self._daemon.stdin.flush()
+            reply = json.loads(self._read_daemon_line())
+            return subprocess.CompletedProcess(
+                full_command, reply["returncode"], reply["stdout"], reply["stderr"]
+            )
+        except (OSError, EOFError, ValueError, KeyError, TypeError) as e:
+            # Older engines print their usage and exit instead of replying;
+            # one that stops answering is killed rather than waited for
+            self._daemon_supported = False
+            self._close_daemon(kill=isinstance(e, TimeoutError))
+            return None
+    
+    def _read_daemon_line(self) -> bytes:
+        """Read one reply line from the persistent engine
+        
+        Raises TimeoutError if no complete line arrives within
+        _DAEMON_REPLY_TIMEOUT seconds, and EOFError if the engine exits.
+        """
+        import select
+        import time
+        
+        fd = self._daemon.stdout.fileno()
+        deadline = time.monotonic() + _DAEMON_REPLY_TIMEOUT
+        while b"\n" not in self._daemon_buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError("engine did not reply in time")
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError("engine exited")
+            self._daemon_buffer += chunk
+        line, _, self._daemon_buffer = self._daemon_buffer.partition(b"\n")
+        return line
+    
+    def _close_daemon(self, kill: bool = False):
+        """Shut down the persistent engine process, if running"""
+        daemon, self._daemon = self._daemon, None
+        _engines_with_daemon.discard(self)
+        if daemon is None:
+            return
+        if kill:
+            daemon.kill()
+        try:
+            daemon.stdin.close()
+        except OSError:
+            pass
+        try:
+            daemon.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            daemon.kill()
+            daemon.wait()
+        daemon.stdout.close()
+    
+    def _run_engine_stream(self, command: List[str]) -> int:
+        """Run the C++ engine with its output going straight to the terminal
+        
+        Returns the engine's exit code.
+        """
+        returncode = subprocess.run(self._engine_command(command), close_fds=False).returncode
+        if command[0] in _MUTATING_COMMANDS:
+            self._cache.clear()
+        return returncode
     
     def detect_backend(self) -> Optional[str]:
         """Detect the current backend"""
@@ -62,9 +274,22 @@ class UVStartEngine:
         """Get list of all available backends"""
         result = self._run_engine(["backends"])
         if result.returncode == 0:
-            return result.stdout.strip().split("\n")
+            return [line for line in result.stdout.splitlines() if line]
         return []
     
+    def get_info(self) -> Optional[Dict[str, Any]]:
+        """Get current backend, available backends and version in one engine call
+        
+        Returns None when the engine does not support the info command.
+        """
+        result = self._run_engine(["info", "--json"])
+        if result.returncode != 0:
+            return None
+        try:
+            return json.loads(result.stdout)
+        except ValueError:
+            return None
+    
     def add_package(self, package: str, dev: bool = False, backend: str = "") -> bool:
         """Add a package"""
         command = ["add", package]
@@ -73,13 +298,10 @@ class UVStartEngine:
         if backend:
             command.extend(["--backend", backend])
         
-        result = self._run_engine(command)
-        if result.returncode != 0:
-            print(f"Error adding package: {result.stderr}", file=sys.stderr)
+        returncode = self._run_engine_stream(command)
+        if returncode != 0:
+            print(f"Error adding package: engine exited with status {returncode}", file=sys.stderr)
             return False
-        
-        if result.stdout:
-            print(result.stdout, end="")
         return True
     
     def remove_package(self, package: str, backend: str = "") -> bool:
@@ -88,13 +310,10 @@ class UVStartEngine:
         if backend:
             command.extend(["--backend", backend])
         
-        result = self._run_engine(command)
-        if result.returncode != 0:
-            print(f"Error removing package: {result.stderr}", file=sys.stderr)
+        returncode = self._run_engine_stream(command)
+        if returncode != 0:
+            print(f"Error removing package: engine exited with status {returncode}", file=sys.stderr)
             return False
-        
-        if result.stdout:
-            print(result.stdout, end="")
         return True
     
     def sync_packages(self, dev: bool = False, backend: str = "") -> bool:
@@ -105,13 +324,10 @@ class UVStartEngine:
         if backend:
             command.extend(["--backend", backend])
         
-        result = self._run_engine(command)
-        if result.returncode != 0:
-            print(f"Error syncing packages: {result.stderr}", file=sys.stderr)
+        returncode = self._run_engine_stream(command)
+        if returncode != 0:
+            print(f"Error syncing packages: engine exited with status {returncode}", file=sys.stderr)
             return False
-        
-        if result.stdout:
-            print(result.stdout, end="")
         return True
     
     def run_command(self, command: List[str], backend: str = "") -> bool:
@@ -120,13 +336,10 @@ class UVStartEngine:
         if backend:
             run_cmd.extend(["--backend", backend])
         
-        result = self._run_engine(run_cmd)
-        if result.returncode != 0:
-            print(f"Error running command: {result.stderr}", file=sys.stderr)
+        returncode = self._run_engine_stream(run_cmd)
+        if returncode != 0:
+            print(f"Error running command: engine exited with status {returncode}", file=sys.stderr)
             return False
-        
-        if result.stdout:
-            print(result.stdout, end="")
         return True
     
     def list_packages(self, backend: str = "") -> bool:
@@ -135,13 +348,10 @@ class UVStartEngine:
         if backend:
             command.extend(["--backend", backend])
         
-        result = self._run_engine(command)
-        if result.returncode != 0:
-            print(f"Error listing packages: {result.stderr}", file=sys.stderr)
+        returncode = self._run_engine_stream(command)
+        if returncode != 0:
+            print(f"Error listing packages: engine exited with status {returncode}", file=sys.stderr)
             return False
-        
-        if result.stdout:
-            print(result.stdout, end="")
         return True
     
     def get_version(self, backend: str = "") -> Optional[str]:
@@ -161,13 +371,10 @@ class UVStartEngine:
         if backend:
             command.extend(["--backend", backend])
         
-        result = self._run_engine(command)
-        if result.returncode != 0:
-            print(f"Error cleaning project: {result.stderr}", file=sys.stderr)
+        returncode = self._run_engine_stream(command)
+        if returncode != 0:
+            print(f"Error cleaning project: engine exited with status {returncode}", file=sys.stderr)
             return False
-        
-        if result.stdout:
-            print(result.stdout, end="")
         return True
     
     def get_install_command(self, backend: str) -> Optional[str]:
@@ -181,43 +388,66 @@ class UVStartEngine:
         """Get list of files that would be cleaned for a backend"""
         result = self._run_engine(["clean-files", backend])
         if result.returncode == 0:
-            return result.stdout.strip().split("\n")
+            return [line for line in result.stdout.splitlines() if line]
         return []
 
 
 def format_backend_info(engine: UVStartEngine) -> str:
     """Format backend information for display"""
-    current = engine.detect_backend()
-    available = engine.get_available_backends()
+    info = engine.get_info()
+    if info is not None:
+        current = info.get("current")
+        available = info.get("available") or []
+        version = info.get("version")
+    else:
+        # Older engines without the info command
+        current = engine.detect_backend()
+        available = engine.get_available_backends()
+        version = engine.get_version() if current else None
     
     output = []
     output.append("Backend Information:")
     output.append(f"  Current: {current or 'None detected'}")
     output.append(f"  Available: {', '.join(available)}")
     
-    if current:
-        version = engine.get_version()
-        if version:
-            output.append(f"  Version: {version}")
+    if current and version:
+        output.append(f"  Version: {version}")
     
     return "\n".join(output)
 
 
+def _fast_write(path: Path, data: bytes) -> None:
+    """Write bytes to a file with raw os calls, skipping Python's file object layer"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def generate_project(args) -> int:
     """Generate new project using template system (handles both new projects and in-place init)"""
     import shutil
+    from config_manager import get_config
     
     # Get configuration for defaults
     config = get_config()
     
-    # Apply configuration defaults if not specified
-    backend = getattr(args, 'backend', None) or config.get_backend()
-    python_version = getattr(args, 'python_version', None) or config.get_python_version()
-    author = getattr(args, 'author', None) or config.get_author()
-    email = getattr(args, 'email', None) or config.get_email()
+    # Apply configuration defaults if not specified; both the generate
+    # parser and init_project always set these attributes (None when omitted)
+    defaults = config.get_all_defaults()
+    backend = args.backend or defaults['backend']
+    python_version = args.python_version or defaults['python_version']
+    author = args.author or defaults['author']
+    email = args.email or defaults['email']
     
     # Determine if this is in-place initialization or new project creation
-    is_in_place = args.name_or_path == "." or Path(args.name_or_path).resolve() == Path.cwd().resolve()
+    # Plain string matches settle the common cases without resolving symlinks
+    cwd = Path.cwd()
+    is_in_place = (args.name_or_path in (".", "", os.fspath(cwd))
+                   or Path(args.name_or_path).resolve() == cwd.resolve())
     
     # Determine project name and target directory
     if is_in_place:
@@ -243,13 +473,14 @@ def generate_project(args) -> int:
         
         # Initialize validator for comprehensive checks
         validator = InitValidator()
+        resolved_dir = target_dir.resolve()
         
         # Validate all inputs
         valid = True
         valid &= validator.validate_python_version(python_version)
         valid &= validator.validate_backend(backend)
         valid &= validator.validate_features(args.features)
-        valid &= validator.validate_directory(str(target_dir.resolve()))
+        valid &= validator.validate_directory(str(resolved_dir))
         valid &= validator.validate_git(args.no_git)
         
         # Print any issues
@@ -259,18 +490,22 @@ def generate_project(args) -> int:
             print("\nInitialization failed due to validation errors.")
             return 1
         
-        print(f"\nProject configuration:")
-        print(f"  Name: {project_name}")
-        print(f"  Python: {python_version}")
-        print(f"  Backend: {backend}")
-        print(f"  Features: {', '.join(args.features) if args.features else 'none'}")
-        print(f"  Path: {target_dir.resolve()}")
-        print(f"  Git: {'disabled' if args.no_git else 'enabled'}")
+        output = []
+        output.append(f"\nProject configuration:")
+        output.append(f"  Name: {project_name}")
+        output.append(f"  Python: {python_version}")
+        output.append(f"  Backend: {backend}")
+        output.append(f"  Features: {', '.join(args.features) if args.features else 'none'}")
+        output.append(f"  Path: {resolved_dir}")
+        output.append(f"  Git: {'disabled' if args.no_git else 'enabled'}")
+        sys.stdout.write("\n".join(output) + "\n")
     else:
         # For new projects, show brief summary
         features_str = f" with {', '.join(args.features)}" if args.features else ""
         print(f"Creating {project_name}: backend={backend}, python={python_version}{features_str}")
     
+    from simple_templates import SimpleTemplateManager, TemplateContext
+    
     # Create template context
     context = TemplateContext(
         project_name=project_name,
@@ -284,20 +519,22 @@ def generate_project(args) -> int:
     )
     
     # Generate project structure using integrated template system that supports user templates
-    if ENHANCED_TEMPLATES:
+    if _enhanced_templates():
         try:
-            from template_manager import IntegratedTemplateManager
-            manager = IntegratedTemplateManager()
+            manager = _integrated_manager()
             
             # Check if we have any user template features
             user_features = []
             builtin_features = []
             
+            template_types = {}
+            if args.features:
+                for template in manager.list_available_templates():
+                    # The first template listed under a name wins, as before
+                    template_types.setdefault(template.name, template.type)
+            
             for feature in (args.features or []):
-                templates = manager.list_available_templates()
-                feature_template = next((t for t in templates if t.name == feature), None)
-                
-                if feature_template and feature_template.type == "user":
+                if template_types.get(feature) == "user":
                     user_features.append(feature)
                 else:
                     builtin_features.append(feature)
@@ -347,49 +584,54 @@ def generate_project(args) -> int:
             return 1
     
     try:
-        # Remember original directory for git operations
-        original_cwd = os.getcwd()
-        
-        # Write all files
-        created_files = []
-        for file_path, content in files.items():
-            full_path = target_dir / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            created_files.append(file_path)
+        # Create each distinct parent directory once, then write all files;
+        # shallowest first, so every mkdir finds its parent already there
+        parents = {(target_dir / file_path).parent for file_path in files}
+        parents.discard(target_dir)
+        for parent in sorted(parents, key=lambda d: len(d.parts)):
+            parent.mkdir(parents=True, exist_ok=True)
+        
+        # Every file has its own path, so the writes can run concurrently
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            writes = [
+                executor.submit(_fast_write, target_dir / file_path, content.encode('utf-8'))
+                for file_path, content in files.items()
+            ]
+        for write in writes:
+            # Re-raise the first failure, if any
+            write.result()
+        created_files = list(files)
         
         # Initialize git if requested and not disabled
-        if not args.no_git and shutil.which("git"):
+        if not args.no_git and _which("git"):
             try:
-                # Change to project directory for git operations
-                os.chdir(target_dir)
-                
-                subprocess.run(["git", "init"], check=True, capture_output=True)
-                subprocess.run(["git", "add", "."], check=True, capture_output=True)
-                subprocess.run(["git", "commit", "-m", f"Initial commit for {project_name}"], 
-                             check=True, capture_output=True)
+                # Run git in the project directory instead of changing ours
+                git = functools.partial(subprocess.run, cwd=target_dir, check=True, capture_output=True,
+                                        close_fds=False)
+                git(["git", "init", "--quiet"])
+                git(["git", "add", "-A"])
+                git(["git", "commit", "--quiet", "-m", f"Initial commit for {project_name}"])
                 if is_in_place:
                     print("Git repository initialized")
             except subprocess.CalledProcessError as e:
                 if is_in_place:
                     print(f"Warning: Git initialization failed: {e}")
-            finally:
-                os.chdir(original_cwd)
         
-        # Success message
+        # Success message, written in one go
+        output = []
         if is_in_place:
-            print(f"\nProject '{project_name}' initialized successfully!")
+            output.append(f"\nProject '{project_name}' initialized successfully!")
         else:
-            print(f" Project created: {target_dir.name}/ ({len(created_files)} files)")
+            output.append(f" Project created: {target_dir.name}/ ({len(created_files)} files)")
         
         if is_in_place:
-            print(f"Created {len(created_files)} files:")
-            for file_path in sorted(created_files):
-                print(f"  {file_path}")
+            output.append(f"Created {len(created_files)} files:")
+            output.extend(f"  {file_path}" for file_path in sorted(created_files))
         
-        print(f"Next: {output_hint} && {backend} sync")
+        output.append(f"Next: {output_hint} && {backend} sync")
+        sys.stdout.write("\n".join(output) + "\n")
         
         return 0
     
@@ -398,6 +640,13 @@ def generate_project(args) -> int:
         return 1
 
 
+def _in_git_repo(path: str) -> bool:
+    """Check whether path is inside a git work tree without running git"""
+    resolved = Path(path).resolve()
+    # .git is a directory in a normal checkout and a file in worktrees/submodules
+    return any(os.path.exists(parent / ".git") for parent in (resolved, *resolved.parents))
+
+
 class InitValidator:
     """Validation functions for project initialization"""
     
@@ -407,10 +656,8 @@ class InitValidator:
     
     def validate_python_version(self, version: str) -> bool:
         """Validate Python version format and availability"""
-        import re, shutil
-        
         # Check format (e.g., 3.11, 3.12)
-        if not re.match(r'^3\.\d+$', version):
+        if not _PY_VERSION_RE.match(version):
             self.errors.append(f"Invalid Python version format: {version}. Expected format: 3.11, 3.12, etc.")
             return False
         
@@ -420,20 +667,33 @@ class InitValidator:
             self.errors.append(f"Python {version} is not supported. Minimum version is 3.8")
             return False
         
-        # Try to find the Python executable
-        python_cmds = [f"python{version}", f"python3.{minor}", "python3", "python"]
+        # Try to find the Python executable; python{version} and python3.{minor}
+        # are usually the same name, so drop duplicates
+        python_cmds = list(dict.fromkeys([f"python{version}", f"python3.{minor}", "python3", "python"]))
         python_cmd = None
         
+        # A real python3.Y executable is that version; no need to start it
         for cmd in python_cmds:
-            if shutil.which(cmd):
-                try:
-                    result = subprocess.run([cmd, "--version"], capture_output=True, text=True, timeout=5)
-                    found_version = result.stdout.strip().split()[1]
+            if _PY_VERSIONED_CMD_RE.match(cmd):
+                path = _which(cmd)
+                if path and not _is_script(path):
+                    python_cmd = cmd
+                    break
+        
+        if not python_cmd:
+            # Start every candidate at once; python3 and python are also what
+            # the error below lists
+            _prefetch_versions(python_cmds)
+            for cmd in python_cmds:
+                path, stdout = _probe_version(cmd)
+                if path and stdout is not None:
+                    try:
+                        found_version = stdout.strip().split()[1]
+                    except IndexError:
+                        continue
                     if found_version.startswith(version + "."):
                         python_cmd = cmd
                         break
-                except (subprocess.TimeoutExpired, subprocess.SubprocessError, IndexError):
-                    continue
         
         if not python_cmd:
             self.errors.append(f"Python {version} not found on system")
@@ -441,40 +701,29 @@ class InitValidator:
             # Show available Python versions
             available = []
             for cmd in ["python3", "python"]:
-                if shutil.which(cmd):
-                    try:
-                        result = subprocess.run([cmd, "--version"], capture_output=True, text=True, timeout=5)
-                        available.append(result.stdout.strip())
-                    except:
-                        pass
+                path, stdout = _probe_version(cmd)
+                if path and stdout is not None:
+                    available.append(stdout.strip())
             if available:
                 self.errors.append(f"Available Python versions: {', '.join(available)}")
             return False
         
-        print(f"Found Python {version} at: {shutil.which(python_cmd)}")
+        print(f"Found Python {version} at: {_which(python_cmd)}")
         return True
     
     def validate_backend(self, backend: str) -> bool:
         """Validate backend availability"""
-        import shutil
-        
-        backend_configs = {
-            "pdm": "curl -sSL https://pdm-project.org/install-pdm.py | python3 -",
-            "uv": "curl -LsSf https://astral.sh/uv/install.sh | sh",
-            "poetry": "curl -sSL https://install.python-poetry.org | python3 -"
-        }
-        
-        if backend not in backend_configs:
+        if backend not in _BACKEND_INSTALL_CMDS:
             self.errors.append(f"Unknown backend: {backend}")
-            self.errors.append(f"Supported backends: {', '.join(backend_configs.keys())}")
+            self.errors.append(f"Supported backends: {', '.join(_BACKEND_INSTALL_CMDS.keys())}")
             return False
         
-        if not shutil.which(backend):
+        if not _which(backend):
             self.errors.append(f"Backend '{backend}' selected but {backend} is not installed")
-            self.errors.append(f"Install {backend}: {backend_configs[backend]}")
+            self.errors.append(f"Install {backend}: {_BACKEND_INSTALL_CMDS[backend]}")
             return False
         
-        print(f"Found {backend}: {shutil.which(backend)}")
+        print(f"Found {backend}: {_which(backend)}")
         return True
     
     def validate_features(self, features: Optional[List[str]]) -> bool:
@@ -487,16 +736,14 @@ class InitValidator:
             
             # Also check integrated template manager for user templates
             try:
-                from template_manager import IntegratedTemplateManager
-                integrated_manager = IntegratedTemplateManager()
-                user_templates = integrated_manager.list_available_templates()
+                user_templates = _integrated_manager().list_available_templates()
                 user_features = [t.name for t in user_templates if t.type == "user"]
                 valid_features.extend(user_features)
             except ImportError:
                 pass
         except:
             # Fallback to basic features if template manager fails
-            valid_features = ["cli", "web", "notebook", "pytorch"]
+            valid_features = _BASIC_FEATURES
         
         if features:
             for feature in features:
@@ -512,14 +759,22 @@ class InitValidator:
         """Validate directory for project creation"""
         # Check if directory is empty or only contains hidden files
         try:
-            entries = os.listdir(path)
-            visible_entries = [e for e in entries if not e.startswith('.')]
+            # Only the first few names are shown; the rest are just counted
+            shown, more = [], 0
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if len(shown) < 5:
+                        shown.append(entry.name)
+                    else:
+                        more += 1
             
-            if visible_entries:
-                self.warnings.append(f"Directory is not empty: {len(visible_entries)} files found")
-                print(f"Directory contains: {', '.join(visible_entries[:5])}")
-                if len(visible_entries) > 5:
-                    print(f"... and {len(visible_entries) - 5} more files")
+            if shown:
+                self.warnings.append(f"Directory is not empty: {len(shown) + more} files found")
+                print(f"Directory contains: {', '.join(shown)}")
+                if more:
+                    print(f"... and {more} more files")
                     
                 response = input("Continue anyway? [y/N] ").strip().lower()
                 if response not in ['y', 'yes']:
@@ -538,25 +793,19 @@ class InitValidator:
     
     def validate_git(self, no_git: bool = False) -> bool:
         """Validate git setup"""
-        import shutil
-        
         if no_git:
             return True
         
-        if not shutil.which("git"):
+        if not _which("git"):
             self.warnings.append("Git not found. Skipping git initialization")
             return False
         
         # Check if already in a git repo
-        try:
-            subprocess.run(["git", "rev-parse", "--git-dir"], 
-                         capture_output=True, check=True, timeout=5)
+        if _in_git_repo("."):
             self.warnings.append("Already in a git repository")
             response = input("Initialize anyway? [y/N] ").strip().lower()
             if response not in ['y', 'yes']:
                 return False
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            pass  # Not in a git repo, which is good
         
         print("Git is available")
         return True
@@ -600,6 +849,86 @@ def init_project(args) -> int:
     return generate_project(generate_args)
 
 
+# Python interpreters looked for by the doctor command, newest first
+_PYTHON_COMMANDS = ("python3.13", "python3.12", "python3.11", "python3.10", "python3.9", "python3.8", "python3", "python")
+
+# Every command the doctor command runs `--version` on
+_DOCTOR_PROBES = _PYTHON_COMMANDS + ("uv", "poetry", "pip3", "pip", "git", "code", "gh", "docker")
+
+
+def _is_script(path: str) -> bool:
+    """Check whether an executable is an interpreted (#!) script"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(2) == b'#!'
+    except OSError:
+        return True
+
+
+@functools.lru_cache(maxsize=None)
+def _os_pretty_name() -> Optional[str]:
+    """Distribution name from /etc/os-release, read directly rather than via lsb_release"""
+    import shlex
+    
+    try:
+        with open("/etc/os-release", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("PRETTY_NAME="):
+                    # Values use shell quoting
+                    values = shlex.split(line.split("=", 1)[1])
+                    return values[0] if values else None
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _scan_dir(path: Path) -> Optional[Dict[str, os.DirEntry]]:
+    """Map the names in a directory to their entries; None if it can't be read"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return None
+
+
+def _is_executable_entry(entry: Optional[os.DirEntry]) -> bool:
+    """Check whether a directory entry is a file with an execute bit set"""
+    try:
+        return entry is not None and entry.is_file() and bool(entry.stat().st_mode & 0o111)
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_version(cmd: str) -> Tuple[Optional[str], Optional[str]]:
+    """Locate a command and capture its --version output
+    
+    Returns (path, stdout); path is None when the command is not on PATH
+    and stdout is None when running it failed. Each command is probed at
+    most once per run, shared by the init validator and the doctor checks.
+    """
+    path = _which(cmd)
+    if path is None:
+        return None, None
+    try:
+        result = _run([path, "--version"], timeout=5)
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+        return path, None
+    return path, result.stdout
+
+
+def _prefetch_versions(commands) -> None:
+    """Run _probe_version for the given commands concurrently, so later
+    lookups in any order are answered from its cache"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    pending = list(dict.fromkeys(commands))
+    if len(pending) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+        list(executor.map(_probe_version, pending))
+
+
 class SystemChecker:
     """System health checker for uvstart doctor command"""
     
@@ -607,26 +936,27 @@ class SystemChecker:
         self.errors = 0
         self.warnings = 0
     
+    def prefetch(self, commands) -> None:
+        """Run version probes for the given commands concurrently"""
+        _prefetch_versions(commands)
+    
     def check_command(self, cmd: str, name: str, install_hint: str = "") -> bool:
         """Check if a command is available and get its version"""
-        import shutil
-        
-        if shutil.which(cmd):
-            try:
-                result = subprocess.run([cmd, "--version"], capture_output=True, text=True, timeout=5)
-                # Try to extract version number
-                version_line = result.stdout.split('\n')[0] if result.stdout else "unknown"
-                # Simple version extraction
-                import re
-                version_match = re.search(r'[0-9]+\.[0-9]+(?:\.[0-9]+)?', version_line)
-                version = version_match.group() if version_match else "unknown"
-                
-                print(f"SUCCESS: {name}: {version} ({shutil.which(cmd)})")
-                return True
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+        path, stdout = _probe_version(cmd)
+        if path:
+            if stdout is None:
                 print(f"WARNING: {name}: found but version check failed")
                 self.warnings += 1
                 return True
+            
+            # Try to extract version number
+            version_line = stdout.split('\n')[0] if stdout else "unknown"
+            # Simple version extraction
+            version_match = _VERSION_RE.search(version_line)
+            version = version_match.group() if version_match else "unknown"
+            
+            print(f"SUCCESS: {name}: {version} ({path})")
+            return True
         else:
             print(f"ERROR: {name}: Not found")
             if install_hint:
@@ -639,31 +969,35 @@ class SystemChecker:
         print("INFO: Checking Python installations...")
         
         found_python = False
-        python_cmds = ["python3.13", "python3.12", "python3.11", "python3.10", "python3.9", "python3.8", "python3", "python"]
         
-        for py_cmd in python_cmds:
-            if shutil.which(py_cmd):
-                try:
-                    result = subprocess.run([py_cmd, "--version"], capture_output=True, text=True, timeout=5)
-                    version = result.stdout.strip().split()[1]
-                    major_minor = ".".join(version.split(".")[:2])
-                    
-                    # Check if version is supported (3.8+)
-                    version_parts = version.split(".")
-                    major, minor = int(version_parts[0]), int(version_parts[1])
-                    
-                    if major == 3 and minor >= 8:
-                        print(f"SUCCESS: Python {version} ({shutil.which(py_cmd)})")
-                        found_python = True
-                    elif major == 3 and minor < 8:
-                        print(f"WARNING: Python {version} - outdated, recommend 3.8+")
-                        self.warnings += 1
-                        found_python = True
-                    else:
-                        print(f"WARNING: Python {version} - unsupported")
-                        self.warnings += 1
-                except (subprocess.TimeoutExpired, subprocess.SubprocessError, IndexError):
-                    continue
+        self.prefetch(_PYTHON_COMMANDS)
+        
+        for py_cmd in _PYTHON_COMMANDS:
+            path, stdout = _probe_version(py_cmd)
+            if not path or stdout is None:
+                continue
+            try:
+                version = stdout.strip().split()[1]
+            except IndexError:
+                continue
+            
+            try:
+                # Check if version is supported (3.8+)
+                version_parts = version.split(".")
+                major, minor = int(version_parts[0]), int(version_parts[1])
+            except (IndexError, ValueError):
+                continue
+            
+            if major == 3 and minor >= 8:
+                print(f"SUCCESS: Python {version} ({path})")
+                found_python = True
+            elif major == 3 and minor < 8:
+                print(f"WARNING: Python {version} - outdated, recommend 3.8+")
+                self.warnings += 1
+                found_python = True
+            else:
+                print(f"WARNING: Python {version} - unsupported")
+                self.warnings += 1
         
         if not found_python:
             print("ERROR: No Python 3 installation found")
@@ -674,25 +1008,22 @@ class SystemChecker:
         """Check package managers"""
         print("INFO: Checking package managers...")
         
-        # Check uv
-        if self.check_command("uv", "uv", "curl -LsSf https://astral.sh/uv/install.sh | sh"):
-            # Additional check for uv configuration
-            try:
-                subprocess.run(["uv", "--help"], capture_output=True, check=True, timeout=5)
-                print("SUCCESS: uv is properly configured")
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                print("WARNING: uv found but not properly configured")
-                self.warnings += 1
+        # Check uv; a successful --version probe already shows it runs
+        self.check_command("uv", "uv", "curl -LsSf https://astral.sh/uv/install.sh | sh")
         
         # Check poetry
         self.check_command("poetry", "Poetry", "curl -sSL https://install.python-poetry.org | python3 -")
         
         # Check pip
-        pip_cmd = "pip3" if shutil.which("pip3") else "pip"
-        if shutil.which(pip_cmd):
+        path, stdout = _probe_version("pip3")
+        if not path:
+            path, stdout = _probe_version("pip")
+        if path and stdout is None:
+            print("WARNING: pip found but version check failed")
+            self.warnings += 1
+        elif path:
             try:
-                result = subprocess.run([pip_cmd, "--version"], capture_output=True, text=True, timeout=5)
-                version = result.stdout.split()[1] if result.stdout else "unknown"
+                version = stdout.split()[1] if stdout else "unknown"
                 print(f"SUCCESS: pip: {version}")
             except:
                 print("WARNING: pip found but version check failed")
@@ -723,24 +1054,24 @@ class SystemChecker:
         # Get the script directory
         script_path = Path(__file__).parent.parent
         
-        if script_path.exists():
+        # Answer the existence checks from one directory listing per directory
+        entries = _scan_dir(script_path)
+        if entries is not None:
             print(f"SUCCESS: uvstart directory: {script_path}")
             
             # Check if uvstart executable exists (new isolated installation structure)
-            uvstart_exec = script_path / "bin" / "uvstart"
-            if uvstart_exec.exists() and os.access(uvstart_exec, os.X_OK):
-                print(f"SUCCESS: uvstart executable: {uvstart_exec}")
+            bin_entries = _scan_dir(script_path / "bin") if "bin" in entries else None
+            if bin_entries and _is_executable_entry(bin_entries.get("uvstart")):
+                print(f"SUCCESS: uvstart executable: {script_path / 'bin' / 'uvstart'}")
+            # Fallback check for legacy installation
+            elif _is_executable_entry(entries.get("uvstart")):
+                print(f"SUCCESS: uvstart executable: {script_path / 'uvstart'}")
             else:
-                # Fallback check for legacy installation
-                legacy_exec = script_path / "uvstart"
-                if legacy_exec.exists() and os.access(legacy_exec, os.X_OK):
-                    print(f"SUCCESS: uvstart executable: {legacy_exec}")
-                else:
-                    print("ERROR: uvstart executable not found or not executable")
-                    self.errors += 1
+                print("ERROR: uvstart executable not found or not executable")
+                self.errors += 1
             
             # Check if it's accessible as a command
-            if shutil.which("uvstart"):
+            if _which("uvstart"):
                 print("SUCCESS: uvstart is in PATH")
             else:
                 print("WARNING: uvstart not in PATH")
@@ -748,17 +1079,16 @@ class SystemChecker:
                 self.warnings += 1
             
             # Check C++ engine
-            engine_path = script_path / "engine" / "uvstart-engine"
-            if engine_path.exists():
-                print(f"SUCCESS: C++ engine: {engine_path}")
+            engine_entries = _scan_dir(script_path / "engine") if "engine" in entries else None
+            if engine_entries and "uvstart-engine" in engine_entries:
+                print(f"SUCCESS: C++ engine: {script_path / 'engine' / 'uvstart-engine'}")
             else:
                 print("ERROR: C++ engine not found")
                 print("   Run: cd engine && make")
                 self.errors += 1
             
             # Check template files
-            templates_dir = script_path / "templates"
-            if templates_dir.exists():
+            if "templates" in entries:
                 print(f"SUCCESS: Templates directory found")
             else:
                 print("ERROR: Templates directory not found")
@@ -777,28 +1107,17 @@ class SystemChecker:
         if system == "Darwin":
             print("SUCCESS: Operating system: macOS")
             try:
-                result = subprocess.run(["sw_vers"], capture_output=True, text=True, timeout=5)
+                result = _run(["sw_vers"], timeout=5)
                 for line in result.stdout.strip().split('\n'):
                     print(f"   {line}")
             except:
                 pass
         elif system == "Linux":
             print("SUCCESS: Operating system: Linux")
-            # Try to get distribution info
-            try:
-                result = subprocess.run(["lsb_release", "-d"], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    print(f"   {result.stdout.strip()}")
-                elif os.path.exists("/etc/os-release"):
-                    with open("/etc/os-release") as f:
-                        for line in f:
-                            if line.startswith("PRETTY_NAME="):
-                                # Extract and clean the OS name
-                                os_name = line.split('=', 1)[1].strip('"\\n')
-                                print(f"   {os_name}")
-                                break
-            except:
-                pass
+            # Distribution info
+            os_name = _os_pretty_name()
+            if os_name:
+                print(f"   {os_name}")
         else:
             print(f"SUCCESS: Operating system: {system}")
         
@@ -821,13 +1140,107 @@ class SystemChecker:
             self.warnings += 1
 
 
+# How long a saved doctor report stays valid when nothing it probed has changed
+_DOCTOR_CACHE_TTL = 3600
+
+
+def _user_cache_dir() -> Path:
+    """Per-user directory for uvstart's saved state"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'uvstart'
+
+
+def _doctor_cache_file() -> Path:
+    """Location of the saved doctor report"""
+    return _user_cache_dir() / 'doctor.json'
+
+
+def _doctor_cache_key() -> str:
+    """Fingerprint of what the doctor checks look at: PATH plus the probed
+    binaries and installation files, with their modification times"""
+    import hashlib
+    
+    install_dir = Path(__file__).parent.parent
+    paths = [(cmd, _which(cmd)) for cmd in sorted(set(_PYTHON_COMMANDS + _DOCTOR_PROBES + ("uvstart",)))]
+    paths += [(name, str(install_dir / name)) for name in ("uvstart", "bin/uvstart", "engine/uvstart-engine", "templates")]
+    
+    parts = [os.environ.get("PATH", "")]
+    for name, path in paths:
+        try:
+            mtime = os.stat(path).st_mtime_ns if path else None
+        except OSError:
+            mtime = None
+        parts.append(f"{name}={path}@{mtime}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
 def doctor_command(args) -> int:
-    """System health check (migrated from shell script)"""
+    """System health check (migrated from shell script)
+    
+    The tool and installation checks are saved and replayed for up to an
+    hour, as long as PATH and the probed binaries are unchanged; --force
+    always re-runs them. System information is always checked live.
+    """
+    import contextlib
+    import io
+    
+    cache_file = _doctor_cache_file()
+    key = _doctor_cache_key()
     checker = SystemChecker()
+    cached_at = None
+    
+    if not getattr(args, 'force', False):
+        try:
+            cached = json.loads(cache_file.read_bytes())
+            if cached["key"] == key and datetime.now().timestamp() - cached["ts"] < _DOCTOR_CACHE_TTL:
+                output = cached["output"]
+                checker.errors = int(cached["errors"])
+                checker.warnings = int(cached["warnings"])
+                cached_at = cached["ts"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
     
+    if cached_at is None:
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            _run_doctor_checks(checker)
+        output = buffer.getvalue()
+        
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.json.tmp')
+            tmp_file.write_text(json.dumps({
+                "key": key,
+                "ts": datetime.now().timestamp(),
+                "output": output,
+                "errors": checker.errors,
+                "warnings": checker.warnings
+            }), encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    
+    sys.stdout.write(output)
+    # Disk space, shell and OS depend on where and how doctor runs, so
+    # they are never replayed
+    checker.check_system_info()
+    returncode = _print_doctor_summary(checker)
+    
+    if cached_at is not None:
+        checked_at = datetime.fromtimestamp(cached_at).strftime("%H:%M")
+        print(f"\nINFO: Tool checks cached from {checked_at}; run 'uvstart doctor --force' to re-check")
+    
+    return returncode
+
+
+def _run_doctor_checks(checker: SystemChecker) -> None:
+    """Run the tool and installation checks and print their report"""
     print("uvstart Environment Health Check")
     print("=" * 50)
     
+    # The probes are independent, so run them all in one batch up front
+    checker.prefetch(_DOCTOR_PROBES)
+    
     # Run all checks
     checker.check_python_versions()
     print()
@@ -837,9 +1250,10 @@ def doctor_command(args) -> int:
     print()
     checker.check_uvstart_installation()
     print()
-    checker.check_system_info()
-    
-    # Summary
+
+
+def _print_doctor_summary(checker: SystemChecker) -> int:
+    """Print the health check summary and return the exit code"""
     print("\n" + "=" * 50)
     print("Health Check Summary:")
     if checker.errors == 0 and checker.warnings == 0:
@@ -864,9 +1278,24 @@ class UpdateManager:
     
     def __init__(self):
         self.install_dir = Path(__file__).parent.parent
+        self._packed_refs: Optional[Tuple[int, Dict[str, str]]] = None
+        # Per-invocation results; the version is reset once HEAD moves
+        self._installation_ok: Optional[bool] = None
+        self._current_version: Optional[str] = None
+        # HEAD and origin/main as of the last check_for_updates()
+        self._last_head_commit: Optional[str] = None
+        self._last_remote_commit: Optional[str] = None
     
     def check_installation(self) -> bool:
-        """Check if uvstart installation is valid for updating"""
+        """Check if uvstart installation is valid for updating
+        
+        The outcome is reported once and remembered for later calls.
+        """
+        if self._installation_ok is None:
+            self._installation_ok = self._check_installation()
+        return self._installation_ok
+    
+    def _check_installation(self) -> bool:
         if not self.install_dir.exists():
             print(f"ERROR: uvstart is not installed in the expected location: {self.install_dir}")
             print("Please install uvstart first using the installer script.")
@@ -874,72 +1303,182 @@ class UpdateManager:
         
         git_dir = self.install_dir / ".git"
         if not git_dir.exists():
+            # installer.sh copies the sources without their .git, so this is
+            # the usual case for an installed uvstart; no git process is run
             print("ERROR: uvstart installation is not a git repository")
-            print("Cannot update automatically. Please reinstall uvstart.")
+            print("Cannot update automatically. Update your uvstart checkout with 'git pull'")
+            print("and re-run installer.sh from it.")
             return False
         
         print(f"SUCCESS: Found uvstart installation at: {self.install_dir}")
         return True
     
-    def get_current_version(self) -> str:
-        """Get current version info"""
+    def _git(self, *args: str, timeout: int = 10, text: bool = False) -> subprocess.CompletedProcess:
+        """Run git in the install dir, capturing its output
+        
+        Output is left as bytes unless ``text`` is set, since most callers
+        only look at the return code.
+        """
+        return _run(("git",) + args, cwd=self.install_dir, text=text, timeout=timeout)
+    
+    def _run_many(self, commands: List[Tuple[str, ...]], timeout: int = 10) -> List[Optional[subprocess.CompletedProcess]]:
+        """Run independent git commands concurrently in the install dir
+        
+        Each command is a tuple of git arguments. Results come back in the
+        order of ``commands`` as text; a command that could not be started
+        or timed out yields None.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def run(args: Tuple[str, ...]) -> Optional[subprocess.CompletedProcess]:
+            try:
+                return self._git(*args, timeout=timeout, text=True)
+            except (subprocess.SubprocessError, OSError):
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(4, len(commands))) as executor:
+            return list(executor.map(run, commands))
+    
+    def _read_head_fast(self) -> Tuple[Optional[str], Optional[str]]:
+        """Read .git/HEAD without running git
+        
+        Returns (branch, None) when HEAD points at a branch and (None, sha)
+        when it is detached; (None, None) if HEAD can't be read.
+        """
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"], 
-                cwd=self.install_dir,
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            if result.returncode == 0:
-                current_commit = result.stdout.strip()[:8]
-                
-                # Get current branch
-                branch_result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    cwd=self.install_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "detached"
-                
-                return f"{current_branch}@{current_commit}"
-            else:
+            head = (self.install_dir / ".git" / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            return None, None
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/"):], None
+        if _GIT_SHA_RE.match(head):
+            return None, head
+        return None, None
+    
+    def _read_packed_refs(self) -> Dict[str, str]:
+        """Refs from .git/packed-refs, re-read only when the file changes"""
+        packed_file = self.install_dir / ".git" / "packed-refs"
+        try:
+            mtime = packed_file.stat().st_mtime_ns
+        except OSError:
+            return {}
+        if self._packed_refs is None or self._packed_refs[0] != mtime:
+            refs = {}
+            try:
+                with open(packed_file, encoding="utf-8") as f:
+                    for line in f:
+                        if line.startswith(("#", "^")):
+                            continue
+                        sha, _, name = line.rstrip("\n").partition(" ")
+                        refs[name] = sha
+            except OSError:
+                return {}
+            self._packed_refs = (mtime, refs)
+        return self._packed_refs[1]
+    
+    def _read_ref(self, ref_path: str) -> Optional[str]:
+        """Resolve a ref such as "HEAD" or "refs/remotes/origin/main" to its
+        SHA by reading .git directly; None means ask git instead"""
+        git_dir = self.install_dir / ".git"
+        for _ in range(5):  # symbolic refs rarely nest more than once
+            try:
+                value = (git_dir / ref_path).read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
+                value = self._read_packed_refs().get(ref_path)
+            except OSError:
+                return None
+            if value is None:
+                return None
+            if not value.startswith("ref: "):
+                return value if _GIT_SHA_RE.match(value) else None
+            ref_path = value[len("ref: "):]
+        return None
+    
+    def get_current_version(self) -> str:
+        """Get current version info
+        
+        HEAD is resolved by reading .git directly, with git as the fallback.
+        """
+        if self._current_version is not None:
+            return self._current_version
+        
+        branch, _ = self._read_head_fast()
+        commit = self._read_ref("HEAD")
+        if commit:
+            current_branch = branch or ""
+            current_commit = commit[:8]
+        else:
+            commit_result, branch_result = self._run_many([
+                ("rev-parse", "HEAD"),
+                ("branch", "--show-current"),
+            ])
+            if commit_result is None or commit_result.returncode != 0:
                 return "unknown"
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-            return "unknown"
+            
+            current_commit = commit_result.stdout.strip()[:8]
+            if branch_result is not None and branch_result.returncode == 0:
+                current_branch = branch_result.stdout.strip()
+            else:
+                current_branch = "detached"
+        version = f"{current_branch}@{current_commit}"
+        
+        self._current_version = version
+        return version
     
-    def get_remote_version(self) -> str:
-        """Get remote version info"""
+    def get_remote_version(self, fetch: bool = True) -> str:
+        """Get remote version info
+        
+        Pass fetch=False when origin has just been fetched to read the
+        remote ref as it is.
+        """
         try:
             # Fetch latest information
-            fetch_result = subprocess.run(
-                ["git", "fetch", "origin"],
-                cwd=self.install_dir,
-                capture_output=True,
-                timeout=30
-            )
-            
-            if fetch_result.returncode != 0:
-                return "unknown"
+            if fetch:
+                fetch_result = self._git("fetch", "--no-tags", "origin", "main", timeout=30)
+                
+                if fetch_result.returncode != 0:
+                    return "unknown"
             
             # Get remote commit
-            result = subprocess.run(
-                ["git", "rev-parse", "origin/main"],
-                cwd=self.install_dir,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            remote_commit = self._read_ref("refs/remotes/origin/main")
+            if remote_commit:
+                return f"main@{remote_commit[:8]}"
+            result = self._git("rev-parse", "origin/main")
             if result.returncode == 0:
-                remote_commit = result.stdout.strip()[:8]
+                remote_commit = result.stdout[:8].decode()
                 return f"main@{remote_commit}"
             else:
                 return "unknown"
         except (subprocess.SubprocessError, subprocess.TimeoutExpired):
             return "unknown"
     
+    def _prefetch_packs(self):
+        """Ask the kernel to start reading git's pack files into the page
+        cache, so the log and reset that follow don't wait on cold reads"""
+        if not hasattr(os, "posix_fadvise"):
+            return
+        import threading
+        
+        def advise():
+            pack_dir = self.install_dir / ".git" / "objects" / "pack"
+            try:
+                packs = [entry.path for entry in os.scandir(pack_dir) if entry.name.endswith(".pack")]
+            except OSError:
+                return
+            for path in packs:
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                except OSError:
+                    pass
+                finally:
+                    os.close(fd)
+        
+        threading.Thread(target=advise, daemon=True).start()
+    
     def check_for_updates(self) -> int:
         """Check if updates are available"""
         print("INFO: Checking for updates...")
@@ -950,12 +1489,7 @@ class UpdateManager:
         
         # Fetch latest from remote
         try:
-            fetch_result = subprocess.run(
-                ["git", "fetch", "origin"],
-                cwd=self.install_dir,
-                capture_output=True,
-                timeout=30
-            )
+            fetch_result = self._git("fetch", "--no-tags", "origin", "main", timeout=30)
             
             if fetch_result.returncode != 0:
                 print("WARNING: Could not fetch from remote repository")
@@ -966,119 +1500,154 @@ class UpdateManager:
             print("Check your internet connection or repository access")
             return 1
         
-        # Get remote version
-        remote_version = self.get_remote_version()
+        self._prefetch_packs()
+        
+        # Read both commits from the refs that fetch just updated; if either
+        # can't be read directly, one rev-parse resolves the pair
+        current_commit = self._read_ref("HEAD")
+        remote_commit = self._read_ref("refs/remotes/origin/main")
+        if current_commit is None or remote_commit is None:
+            try:
+                result = self._git("rev-parse", "HEAD", "origin/main", text=True)
+            except (subprocess.SubprocessError, OSError):
+                result = None
+            commits = result.stdout.split() if result is not None and result.returncode == 0 else []
+            current_commit, remote_commit = commits if len(commits) == 2 else (None, None)
+        
+        remote_version = f"main@{remote_commit[:8]}" if remote_commit else "unknown"
         print(f"INFO: Remote version: {remote_version}")
         
-        # Check if update is needed
+        if current_commit is None:
+            print("WARNING: Could not compare versions")
+            return 1
+        self._last_head_commit, self._last_remote_commit = current_commit, remote_commit
+        
+        if current_commit and current_commit == remote_commit:
+            print("SUCCESS: uvstart is already up to date!")
+            return 2  # Already up to date
+        
+        print("INFO: Update available!")
+        
+        # Show what's new
+        print("\nINFO: Recent changes:")
+        import threading
+        
+        shown = 0
         try:
-            current_commit_result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=self.install_dir,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            remote_commit_result = subprocess.run(
-                ["git", "rev-parse", "origin/main"],
+            with subprocess.Popen(
+                ["git", "log", "--oneline", "--max-count=5", "HEAD..origin/main"],
                 cwd=self.install_dir,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=10
-            )
-            
-            if (current_commit_result.returncode == 0 and 
-                remote_commit_result.returncode == 0 and
-                current_commit_result.stdout.strip() == remote_commit_result.stdout.strip()):
-                
-                print("SUCCESS: uvstart is already up to date!")
-                return 2  # Already up to date
-            else:
-                print("INFO: Update available!")
-                
-                # Show what's new
-                print("\nINFO: Recent changes:")
+                close_fds=False
+            ) as log_proc:
+                # Give up on a git that hangs (e.g. on a lock) after 10
+                # seconds; the timer stays armed until the process has exited
+                deadline = threading.Timer(10, log_proc.kill)
+                deadline.start()
                 try:
-                    log_result = subprocess.run(
-                        ["git", "log", "--oneline", "--max-count=5", "HEAD..origin/main"],
-                        cwd=self.install_dir,
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    if log_result.returncode == 0 and log_result.stdout:
-                        for line in log_result.stdout.strip().split('\n'):
-                            print(f"  {line}")
-                    else:
-                        print("  (Unable to show changes)")
-                except:
-                    print("  (Unable to show changes)")
-                
-                return 0  # Update available
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-            print("WARNING: Could not compare versions")
-            return 1
+                    for line in log_proc.stdout:
+                        print(f"  {line.rstrip()}")
+                        shown += 1
+                    log_proc.wait()
+                finally:
+                    deadline.cancel()
+        except (subprocess.SubprocessError, OSError):
+            pass
+        # Lines already shown stay valid even if git then failed
+        if not shown:
+            print("  (Unable to show changes)")
+        
+        return 0  # Update available
     
     def create_backup(self) -> str:
-        """Create backup of current installation"""
-        from datetime import datetime
+        """Create backup of current installation
+        
+        Working-tree files are copied, so nothing done to the install
+        afterwards (chmod, make, an editor saving in place) can reach the
+        backup. Only git's object store is hard-linked: objects and packs
+        are written once and never modified.
+        """
         backup_name = f"uvstart.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         backup_dir = self.install_dir.parent / backup_name
         
         print("INFO: Creating backup...")
         
+        objects_dir = os.path.join(str(self.install_dir), ".git", "objects") + os.sep
+        
+        # Link git objects, copying wherever a hard link isn't possible
+        # (another filesystem, or one without hard links)
+        def copy_or_link(src, dst):
+            if src.startswith(objects_dir):
+                try:
+                    os.link(src, dst)
+                    return dst
+                except OSError:
+                    pass
+            return shutil.copy2(src, dst)
+        
         try:
-            # Use cp -r to create backup
-            result = subprocess.run(
-                ["cp", "-r", str(self.install_dir), str(backup_dir)],
-                capture_output=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                print(f"SUCCESS: Backup created: {backup_dir}")
-                return str(backup_dir)
-            else:
-                print("ERROR: Failed to create backup")
-                return ""
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
+            shutil.copytree(self.install_dir, backup_dir, symlinks=True,
+                            copy_function=copy_or_link,
+                            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+        except (shutil.Error, OSError):
             print("ERROR: Failed to create backup")
             return ""
+        
+        print(f"SUCCESS: Backup created: {backup_dir}")
+        return str(backup_dir)
     
-    def perform_update(self) -> bool:
-        """Perform the actual update"""
+    def perform_update(self, already_fetched: bool = False) -> bool:
+        """Perform the actual update
+        
+        Pass already_fetched=True when check_for_updates() has just fetched
+        origin, so the update only has to move HEAD locally.
+        """
         print("INFO: Updating uvstart...")
         
         try:
             # Stash any local changes
-            diff_result = subprocess.run(
-                ["git", "diff", "--quiet"],
-                cwd=self.install_dir,
-                capture_output=True,
-                timeout=10
-            )
+            diff_result = self._git("diff", "--quiet", "HEAD")
+            has_changes = diff_result.returncode != 0
             
-            if diff_result.returncode != 0:  # There are changes
+            if has_changes:
                 print("WARNING: Local changes detected, stashing them...")
-                stash_result = subprocess.run(
-                    ["git", "stash", "push", "-m", f"uvstart update {datetime.now().isoformat()}"],
-                    cwd=self.install_dir,
-                    capture_output=True,
-                    timeout=10
-                )
+                stash_result = self._git("stash", "push", "-m", f"uvstart update {datetime.now().isoformat()}")
                 if stash_result.returncode != 0:
                     print("WARNING: Could not stash local changes")
             
-            # Pull latest changes
-            pull_result = subprocess.run(
-                ["git", "pull", "origin", "main"],
-                cwd=self.install_dir,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            if not already_fetched:
+                fetch_result = self._git("fetch", "--no-tags", "origin", "main", timeout=60, text=True)
+                if fetch_result.returncode != 0:
+                    print("ERROR: Failed to update uvstart")
+                    print("Could not fetch from remote repository")
+                    if fetch_result.stderr:
+                        print(f"Error details: {fetch_result.stderr}")
+                    return False
+                self._prefetch_packs()
+            
+            # Fast-forward when the install has no commits of its own,
+            # otherwise merge as 'git pull' would
+            if already_fetched and self._last_head_commit:
+                pre_update_commit = self._last_head_commit
+            else:
+                pre_update_commit = self._read_ref("HEAD")
+            ancestor_result = self._git("merge-base", "--is-ancestor", "HEAD", "origin/main")
+            fast_forward = ancestor_result.returncode == 0
+            if fast_forward:
+                update_args = ("reset", "--keep", "origin/main")
+            else:
+                update_args = ("merge", "--no-edit", "origin/main")
+            pull_result = self._git(*update_args, timeout=60, text=True)
             
             if pull_result.returncode == 0:
+                # A fast-forward lands exactly on the commit the check saw
+                branch, _ = self._read_head_fast()
+                if fast_forward and already_fetched and branch and self._last_remote_commit:
+                    self._current_version = f"{branch}@{self._last_remote_commit[:8]}"
+                else:
+                    self._current_version = None
                 print("SUCCESS: Successfully updated to latest version")
             else:
                 print("ERROR: Failed to update uvstart")
@@ -1089,19 +1658,23 @@ class UpdateManager:
             
             # Make sure the main script is executable
             uvstart_script = self.install_dir / "uvstart"
-            # nosemgrep: python.lang.security.audit.insecure-file-permissions.insecure-file-permissions
-            os.chmod(uvstart_script, 0o755)
+            if (os.stat(uvstart_script).st_mode & 0o777) != 0o755:
+                # nosemgrep: python.lang.security.audit.insecure-file-permissions.insecure-file-permissions
+                os.chmod(uvstart_script, 0o755)
             
-            # Rebuild C++ engine if needed
+            # Rebuild C++ engine if the update touched it (or it was never built)
             engine_dir = self.install_dir / "engine"
-            if engine_dir.exists():
+            engine_changed = True
+            if pre_update_commit and (engine_dir / "uvstart-engine").exists():
+                changed_result = self._git("diff", "--name-only", pre_update_commit, "HEAD", "--", "engine")
+                if changed_result.returncode == 0:
+                    engine_changed = bool(changed_result.stdout.strip())
+            
+            if engine_dir.exists() and not engine_changed:
+                print("INFO: C++ engine unchanged, skipping rebuild")
+            elif engine_dir.exists():
                 print("INFO: Rebuilding C++ engine...")
-                make_result = subprocess.run(
-                    ["make"],
-                    cwd=engine_dir,
-                    capture_output=True,
-                    timeout=120
-                )
+                make_result = _run(["make", f"-j{os.cpu_count() or 1}"], cwd=engine_dir, timeout=120)
                 if make_result.returncode == 0:
                     print("SUCCESS: C++ engine rebuilt successfully")
                 else:
@@ -1122,12 +1695,7 @@ class UpdateManager:
         
         # Check if uvstart command works
         try:
-            version_result = subprocess.run(
-                [str(self.install_dir / "uvstart"), "version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            version_result = _run([str(self.install_dir / "uvstart"), "version"], timeout=10)
             if version_result.returncode == 0:
                 print("SUCCESS: uvstart is working correctly after update")
             else:
@@ -1183,7 +1751,7 @@ def update_command(args) -> int:
             return 1
     
     # Perform update
-    if updater.perform_update():
+    if updater.perform_update(already_fetched=update_status != 1):
         updater.show_post_update_info()
         if backup_path:
             print(f"\nBackup available at: {backup_path}")
@@ -1421,35 +1989,17 @@ def _analyze_git_info(project_path: Path) -> Dict[str, str]:
     
     try:
         # Get current branch
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = _run(["git", "branch", "--show-current"], cwd=project_path, timeout=5)
         if result.returncode == 0 and result.stdout.strip():
             info["Current branch"] = result.stdout.strip()
         
         # Get commit count
-        result = subprocess.run(
-            ["git", "rev-list", "--count", "HEAD"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = _run(["git", "rev-list", "--count", "HEAD"], cwd=project_path, timeout=5)
         if result.returncode == 0:
             info["Commits"] = result.stdout.strip()
         
         # Check for uncommitted changes
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = _run(["git", "status", "--porcelain"], cwd=project_path, timeout=5)
         if result.returncode == 0:
             if result.stdout.strip():
                 info["Status"] = " Uncommitted changes"
@@ -1457,13 +2007,7 @@ def _analyze_git_info(project_path: Path) -> Dict[str, str]:
                 info["Status"] = " Clean"
         
         # Get remote info
-        result = subprocess.run(
-            ["git", "remote", "-v"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = _run(["git", "remote", "-v"], cwd=project_path, timeout=5)
         if result.returncode == 0 and result.stdout.strip():
             lines = result.stdout.strip().split('\n')
             if lines:
@@ -1708,11 +2252,29 @@ def _generate_recommendations(project_path: Path, structure_info: Dict, backend_
     return recommendations
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser with all commands and options"""
-    # Get configuration for defaults
-    config = get_config()
-    defaults = config.get_all_defaults()
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """The subcommand named in argv, or None when it can't be told cheaply"""
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ("--path", "-p", "--backend", "-b"):
+            next(tokens, None)
+        elif token.startswith(("--path=", "--backend=")) or token[:2] in ("-p", "-b"):
+            continue
+        elif token.startswith("-"):
+            return None
+        else:
+            return token
+    return None
+
+
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Create the argument parser with all commands and options
+    
+    Every subcommand is registered, but when ``command`` is given only that
+    subcommand gets its arguments, so a run only pays for the parser it uses.
+    """
+    def needs(name: str) -> bool:
+        return command is None or command == name
     
     parser = argparse.ArgumentParser(
         prog="uvstart",
@@ -1739,48 +2301,52 @@ def create_parser() -> argparse.ArgumentParser:
     # Analyze command (new advanced feature)
     analyze_parser = subparsers.add_parser("analyze", help="Analyze project with Python ecosystem capabilities")
     
+    # Configuration supplies the defaults shown in generate/init help
+    if needs("generate") or needs("init"):
+        from config_manager import get_config
+        defaults = get_config().get_all_defaults()
+    
+    # Available features are looked up only when --features is used or help is shown;
+    # the explicit metavar keeps argparse from listing them while building the parser
+    available_features = _FeatureChoices()
+    
     # Generate command (enhanced to handle both new projects and in-place initialization)
     generate_parser = subparsers.add_parser("generate", help="Generate new project from templates")
-    generate_parser.add_argument("name_or_path", help="Project name or path (use '.' for current directory)")
-    generate_parser.add_argument("--name", help="Project name (required when using '.' as name_or_path)")
-    generate_parser.add_argument("--description", help="Project description")
-    generate_parser.add_argument("--version", default="0.1.0", help="Project version")
-    generate_parser.add_argument("--author", help=f"Author name (default: {defaults['author']})")
-    generate_parser.add_argument("--email", help=f"Author email (default: {defaults['email']})")
-    generate_parser.add_argument("--backend", choices=["uv", "poetry", "pdm"], help=f"Backend to use (default: {defaults['backend']})")
-    generate_parser.add_argument("--python-version", help=f"Python version (default: {defaults['python_version']})")
-    
-    # Get available features dynamically
-    available_features = ["cli", "web", "notebook", "pytorch"]  # Basic features always available
-    if ENHANCED_TEMPLATES:
-        try:
-            manager = TemplateManager()
-            enhanced_features = [t.name for t in manager.list_templates()]
-            available_features = enhanced_features
-        except:
-            pass  # Fall back to basic features
-    
-    generate_parser.add_argument("--features", nargs="*", choices=available_features, help="Features to include")
-    generate_parser.add_argument("--output", default=".", help="Output directory")
-    generate_parser.add_argument("--force", action="store_true", help="Overwrite existing directory")
-    generate_parser.add_argument("--no-git", action="store_true", help="Do not initialize git repository")
+    if needs("generate"):
+        generate_parser.add_argument("name_or_path", help="Project name or path (use '.' for current directory)")
+        generate_parser.add_argument("--name", help="Project name (required when using '.' as name_or_path)")
+        generate_parser.add_argument("--description", help="Project description")
+        generate_parser.add_argument("--version", default="0.1.0", help="Project version")
+        generate_parser.add_argument("--author", help=f"Author name (default: {defaults['author']})")
+        generate_parser.add_argument("--email", help=f"Author email (default: {defaults['email']})")
+        generate_parser.add_argument("--backend", choices=_BACKEND_CHOICES, help=f"Backend to use (default: {defaults['backend']})")
+        generate_parser.add_argument("--python-version", help=f"Python version (default: {defaults['python_version']})")
+        generate_parser.add_argument("--features", nargs="*", choices=available_features, metavar="FEATURE",
+                                     help="Features to include (%(choices)s)")
+        generate_parser.add_argument("--output", default=".", help="Output directory")
+        generate_parser.add_argument("--force", action="store_true", help="Overwrite existing directory")
+        generate_parser.add_argument("--no-git", action="store_true", help="Do not initialize git repository")
     
     # Add command
     add_parser = subparsers.add_parser("add", help="Add package")
-    add_parser.add_argument("package", help="Package name to add")
-    add_parser.add_argument("--dev", action="store_true", help="Add as development dependency")
+    if needs("add"):
+        add_parser.add_argument("package", help="Package name to add")
+        add_parser.add_argument("--dev", action="store_true", help="Add as development dependency")
     
     # Remove command
     remove_parser = subparsers.add_parser("remove", help="Remove package")
-    remove_parser.add_argument("package", help="Package name to remove")
+    if needs("remove"):
+        remove_parser.add_argument("package", help="Package name to remove")
     
     # Sync command
     sync_parser = subparsers.add_parser("sync", help="Sync dependencies")
-    sync_parser.add_argument("--dev", action="store_true", help="Include development dependencies")
+    if needs("sync"):
+        sync_parser.add_argument("--dev", action="store_true", help="Include development dependencies")
     
     # Run command
     run_parser = subparsers.add_parser("run", help="Run command")
-    run_parser.add_argument("cmd", nargs="+", help="Command to run")
+    if needs("run"):
+        run_parser.add_argument("cmd", nargs="+", help="Command to run")
     
     # List command
     list_parser = subparsers.add_parser("list", help="List packages")
@@ -1793,58 +2359,65 @@ def create_parser() -> argparse.ArgumentParser:
     
     # Install command
     install_parser = subparsers.add_parser("install", help="Show installation command for backend")
-    install_parser.add_argument("backend", help="Backend name")
+    if needs("install"):
+        install_parser.add_argument("backend", help="Backend name")
     
     # Init command (convenience alias for generate with in-place behavior)
     init_parser = subparsers.add_parser("init", help="Initialize a new Python project in current directory")
-    init_parser.add_argument("path", nargs="?", default=".", help="Project path (default: current directory)")
-    init_parser.add_argument("--name", help="Project name (defaults to directory basename)")
-    init_parser.add_argument("--python-version", help=f"Python version (default: {defaults['python_version']})")
-    init_parser.add_argument("--backend", choices=["uv", "poetry", "pdm"], help=f"Backend to use (default: {defaults['backend']})")
-    init_parser.add_argument("--features", nargs="*", choices=available_features, help="Features to include")
-    init_parser.add_argument("--no-git", action="store_true", help="Do not initialize git repository")
-    init_parser.add_argument("--description", help="Project description")
-    init_parser.add_argument("--version", default="0.1.0", help="Project version")
-    init_parser.add_argument("--author", help=f"Author name (default: {defaults['author']})")
-    init_parser.add_argument("--email", help=f"Author email (default: {defaults['email']})")
-    init_parser.add_argument("--force", action="store_true", help="Overwrite existing files")
+    if needs("init"):
+        init_parser.add_argument("path", nargs="?", default=".", help="Project path (default: current directory)")
+        init_parser.add_argument("--name", help="Project name (defaults to directory basename)")
+        init_parser.add_argument("--python-version", help=f"Python version (default: {defaults['python_version']})")
+        init_parser.add_argument("--backend", choices=_BACKEND_CHOICES, help=f"Backend to use (default: {defaults['backend']})")
+        init_parser.add_argument("--features", nargs="*", choices=available_features, metavar="FEATURE",
+                                 help="Features to include (%(choices)s)")
+        init_parser.add_argument("--no-git", action="store_true", help="Do not initialize git repository")
+        init_parser.add_argument("--description", help="Project description")
+        init_parser.add_argument("--version", default="0.1.0", help="Project version")
+        init_parser.add_argument("--author", help=f"Author name (default: {defaults['author']})")
+        init_parser.add_argument("--email", help=f"Author email (default: {defaults['email']})")
+        init_parser.add_argument("--force", action="store_true", help="Overwrite existing files")
     
     # Doctor command
     doctor_parser = subparsers.add_parser("doctor", help="Check system health and uvstart installation")
+    if needs("doctor"):
+        doctor_parser.add_argument("--force", action="store_true", help="Ignore saved results and re-run all checks")
     
     # Update command
     update_parser = subparsers.add_parser("update", help="Check for and apply uvstart updates")
-    update_parser.add_argument("--check", action="store_true", help="Only check for updates, don't apply")
-    update_parser.add_argument("--force", action="store_true", help="Force update even if already up to date")
-    update_parser.add_argument("--backup", action="store_true", help="Create a backup of the current installation before updating")
+    if needs("update"):
+        update_parser.add_argument("--check", action="store_true", help="Only check for updates, don't apply")
+        update_parser.add_argument("--force", action="store_true", help="Force update even if already up to date")
+        update_parser.add_argument("--backup", action="store_true", help="Create a backup of the current installation before updating")
     
     # Template management commands
     template_parser = subparsers.add_parser("template", help="Template management and creation")
-    template_subparsers = template_parser.add_subparsers(dest="template_action", help="Template actions")
-    
-    # List templates
-    template_list_parser = template_subparsers.add_parser("list", help="List all available templates")
-    
-    # Template info
-    template_info_parser = template_subparsers.add_parser("info", help="Show detailed template information")
-    template_info_parser.add_argument("template", help="Template name")
-    
-    # Create template from current directory
-    template_from_dir_parser = template_subparsers.add_parser("from-directory", help="Create template from current directory")
-    template_from_dir_parser.add_argument("name", help="Template name")
-    template_from_dir_parser.add_argument("--description", help="Template description")
-    template_from_dir_parser.add_argument("--category", help="Template category")
-    template_from_dir_parser.add_argument("--source", help="Source directory (default: current directory)", default=".")
-    
-    # Create research template
-    template_research_parser = template_subparsers.add_parser("research", help="Create research reproducibility template")
-    template_research_parser.add_argument("name", help="Template name")
-    template_research_parser.add_argument("--description", help="Template description")
-    template_research_parser.add_argument("--source", help="Source directory (default: current directory)", default=".")
-    
-    # Delete template
-    template_delete_parser = template_subparsers.add_parser("delete", help="Delete a user template")
-    template_delete_parser.add_argument("name", help="Template name to delete")
+    if needs("template"):
+        template_subparsers = template_parser.add_subparsers(dest="template_action", help="Template actions")
+        
+        # List templates
+        template_list_parser = template_subparsers.add_parser("list", help="List all available templates")
+        
+        # Template info
+        template_info_parser = template_subparsers.add_parser("info", help="Show detailed template information")
+        template_info_parser.add_argument("template", help="Template name")
+        
+        # Create template from current directory
+        template_from_dir_parser = template_subparsers.add_parser("from-directory", help="Create template from current directory")
+        template_from_dir_parser.add_argument("name", help="Template name")
+        template_from_dir_parser.add_argument("--description", help="Template description")
+        template_from_dir_parser.add_argument("--category", help="Template category")
+        template_from_dir_parser.add_argument("--source", help="Source directory (default: current directory)", default=".")
+        
+        # Create research template
+        template_research_parser = template_subparsers.add_parser("research", help="Create research reproducibility template")
+        template_research_parser.add_argument("name", help="Template name")
+        template_research_parser.add_argument("--description", help="Template description")
+        template_research_parser.add_argument("--source", help="Source directory (default: current directory)", default=".")
+        
+        # Delete template
+        template_delete_parser = template_subparsers.add_parser("delete", help="Delete a user template")
+        template_delete_parser.add_argument("name", help="Template name to delete")
     
     return parser
 
@@ -1857,6 +2430,7 @@ def template_command(args) -> int:
         return 1
     
     try:
+        from template_commands import TemplateManager
         manager = TemplateManager()
         
         if args.template_action == "list":
@@ -1970,7 +2544,7 @@ def template_command(args) -> int:
 
 def main():
     """Main entry point"""
-    parser = create_parser()
+    parser = create_parser(_requested_command(sys.argv[1:]))
     args = parser.parse_args()
     
     if not args.command:
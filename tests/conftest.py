@@ -0,0 +1,9 @@
+"""
+Shared fixtures for the uvstart frontend tests
+"""
+
+import sys
+from pathlib import Path
+
+# The frontend modules import each other by their flat module names
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "frontend"))
@@ -0,0 +1,99 @@
+"""
+Tests for UpdateManager.perform_update against throwaway git repositories
+"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from uvstart import UpdateManager
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _commit_file(repo, name, content, message):
+    (repo / name).write_text(content)
+    _git(repo, "add", name)
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repos(tmp_path, monkeypatch):
+    """An origin with a main branch, an install cloned from it, and a
+    second clone used to push new upstream commits"""
+    global_config = tmp_path / "gitconfig"
+    global_config.write_text("[user]\n\tname = Test\n\temail = test@example.com\n")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+
+    origin = tmp_path / "origin.git"
+    _git(tmp_path, "init", "-q", "--bare", str(origin))
+    _git(origin, "symbolic-ref", "HEAD", "refs/heads/main")
+
+    seed = tmp_path / "seed"
+    _git(tmp_path, "clone", "-q", str(origin), str(seed))
+    _git(seed, "checkout", "-q", "-b", "main")
+    (seed / "uvstart").write_text("#!/bin/sh\n")
+    (seed / "uvstart").chmod(0o755)
+    _git(seed, "add", "uvstart")
+    _commit_file(seed, "README.md", "uvstart\n", "Initial commit")
+    _git(seed, "push", "-q", "origin", "main")
+
+    install = tmp_path / "install"
+    _git(tmp_path, "clone", "-q", str(origin), str(install))
+
+    _commit_file(seed, "NEWS.md", "news\n", "Upstream change")
+    _git(seed, "push", "-q", "origin", "main")
+
+    manager = UpdateManager()
+    manager.install_dir = install
+    calls = []
+    run_git = manager._git
+
+    def recording_git(*args, **kwargs):
+        calls.append(args)
+        return run_git(*args, **kwargs)
+
+    monkeypatch.setattr(manager, "_git", recording_git)
+    return manager, install, origin, calls
+
+
+def test_fast_forward_resets_to_origin(repos):
+    manager, install, origin, calls = repos
+
+    assert manager.perform_update()
+
+    assert ("reset", "--keep", "origin/main") in calls
+    assert not any(call[0] == "merge" for call in calls)
+    assert _git(install, "rev-parse", "HEAD") == _git(origin, "rev-parse", "main")
+
+
+def test_local_commits_are_merged(repos):
+    manager, install, origin, calls = repos
+    _commit_file(install, "LOCAL.md", "local\n", "Local change")
+    local_commit = _git(install, "rev-parse", "HEAD")
+
+    assert manager.perform_update()
+
+    assert ("merge", "--no-edit", "origin/main") in calls
+    assert not any(call[0] == "reset" for call in calls)
+    parents = _git(install, "rev-list", "--parents", "-n", "1", "HEAD").split()[1:]
+    assert sorted(parents) == sorted([local_commit, _git(origin, "rev-parse", "main")])
+    assert (install / "LOCAL.md").exists() and (install / "NEWS.md").exists()
+
+
+def test_staged_local_change_is_stashed(repos):
+    manager, install, origin, calls = repos
+    (install / "README.md").write_text("edited\n")
+    _git(install, "add", "README.md")
+
+    assert manager.perform_update()
+
+    assert any(call[:2] == ("stash", "push") for call in calls)
+    assert _git(install, "rev-parse", "HEAD") == _git(origin, "rev-parse", "main")
+    assert _git(install, "stash", "list")
@@ -0,0 +1,143 @@
+"""
+Tests for template import staging and the template registry change log
+"""
+
+import gzip
+import json
+import os
+import tarfile
+
+import pytest
+
+import user_templates
+from user_templates import UserTemplateManager
+
+
+def _template_info(description="test template"):
+    return {
+        'description': description,
+        'category': 'custom',
+        'author': 'tester',
+        'version': '1.0.0',
+        'created_at': '2024-01-01T00:00:00',
+        'updated_at': '2024-01-01T00:00:00',
+        'is_active': True,
+    }
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return UserTemplateManager(tmp_path / "user_templates")
+
+
+def _make_archive(tmp_path, archive_name, files):
+    """Write a .tar.gz whose top-level directory is 'tpl'"""
+    source = tmp_path / "source" / archive_name / "tpl"
+    source.mkdir(parents=True)
+    for name, data in files.items():
+        (source / name).write_bytes(data)
+    archive = tmp_path / f"{archive_name}.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(source, arcname="tpl")
+    return archive
+
+
+class TestImportStaging:
+    def test_import_creates_template(self, manager, tmp_path):
+        archive = _make_archive(tmp_path, "good", {"main.py": b"print('hi')\n"})
+
+        assert manager.import_template(archive)
+
+        template_dir = manager.user_templates_dir / "templates" / "features" / "tpl"
+        assert (template_dir / "main.py").read_bytes() == b"print('hi')\n"
+
+    def test_reimport_replaces_previous_tree(self, manager, tmp_path):
+        first = _make_archive(tmp_path, "first", {"old.txt": b"old"})
+        second = _make_archive(tmp_path, "second", {"new.txt": b"new"})
+
+        assert manager.import_template(first)
+        assert manager.import_template(second)
+
+        features_dir = manager.user_templates_dir / "templates" / "features"
+        assert sorted(p.name for p in (features_dir / "tpl").iterdir()) == ["new.txt"]
+        assert sorted(p.name for p in features_dir.iterdir()) == ["tpl"]
+
+    @pytest.mark.parametrize("truncate", ["compressed", "tar"])
+    def test_truncated_archive_keeps_existing_template(self, manager, tmp_path, truncate):
+        payload = os.urandom(400000)
+        good = _make_archive(tmp_path, "good", {"big.bin": payload})
+        assert manager.import_template(good)
+
+        update = _make_archive(tmp_path, "update", {"big.bin": os.urandom(400000), "new.txt": b"x"})
+        broken = tmp_path / "broken.tar.gz"
+        if truncate == "compressed":
+            # Cut the gzip stream itself
+            data = update.read_bytes()
+            broken.write_bytes(data[:int(len(data) * 0.7)])
+        else:
+            # A valid gzip stream around a tar cut off inside a member
+            with gzip.open(update, "rb") as f:
+                tar_data = f.read()
+            with gzip.open(broken, "wb") as f:
+                f.write(tar_data[:int(len(tar_data) * 0.7)])
+
+        assert manager.import_template(broken) is False
+
+        features_dir = manager.user_templates_dir / "templates" / "features"
+        assert sorted(p.name for p in features_dir.iterdir()) == ["tpl"]
+        assert sorted(p.name for p in (features_dir / "tpl").iterdir()) == ["big.bin"]
+        assert (features_dir / "tpl" / "big.bin").read_bytes() == payload
+
+    def test_failed_first_import_leaves_nothing_behind(self, manager, tmp_path):
+        archive = _make_archive(tmp_path, "good", {"big.bin": os.urandom(400000)})
+        broken = tmp_path / "broken.tar.gz"
+        data = archive.read_bytes()
+        broken.write_bytes(data[:len(data) // 2])
+
+        assert manager.import_template(broken) is False
+
+        features_dir = manager.user_templates_dir / "templates" / "features"
+        assert list(features_dir.iterdir()) == []
+
+
+class TestRegistryLog:
+    def test_changes_are_replayed_by_a_new_manager(self, manager):
+        manager.register_template("alpha", _template_info("first"))
+        manager.register_template("beta", _template_info())
+        manager.register_template("alpha", _template_info("second"))
+        manager._append_registry_log({'op': 'del', 'name': 'beta'})
+
+        assert manager.registry_log.exists()
+
+        reloaded = UserTemplateManager(manager.user_templates_dir)
+        registry = reloaded._load_registry()
+        assert list(registry) == ["alpha"]
+        assert registry["alpha"]["description"] == "second"
+
+    def test_torn_line_is_skipped(self, manager):
+        manager.register_template("alpha", _template_info())
+        # Simulate an append that was interrupted part way through
+        with open(manager.registry_log, "ab") as f:
+            f.write(b'{"op": "set", "name": "bro')
+        manager.register_template("beta", _template_info())
+
+        reloaded = UserTemplateManager(manager.user_templates_dir)
+        assert sorted(reloaded._load_registry()) == ["alpha", "beta"]
+
+    def test_log_is_compacted_into_registry_json(self, manager):
+        manager.register_template("alpha", _template_info())
+
+        # Rewriting one template keeps the registry at a single entry, so
+        # the log outgrows it after _LOG_COMPACT_RATIO + 1 records
+        for i in range(user_templates._LOG_COMPACT_RATIO):
+            manager.register_template("alpha", _template_info(f"rev {i}"))
+
+        assert not manager.registry_log.exists()
+        saved = json.loads(manager.registry_file.read_bytes())
+        assert saved["alpha"]["description"] == f"rev {user_templates._LOG_COMPACT_RATIO - 1}"
+
+        # Changes after compaction go to a fresh log on top of registry.json
+        manager.register_template("beta", _template_info())
+        assert manager.registry_log.exists()
+        reloaded = UserTemplateManager(manager.user_templates_dir)
+        assert sorted(reloaded._load_registry()) == ["alpha", "beta"]